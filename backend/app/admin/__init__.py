@@ -2,11 +2,17 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from app.core.settings import settings
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from .service import AdminService, get_admin_service
 
 TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+if not settings.debug:
+    # 生产环境模板不会变：跳过每次渲染的 mtime 检查，并把编译结果落盘复用
+    templates.env.auto_reload = False
+    templates.env.bytecode_cache = FileSystemBytecodeCache()
 
 __all__ = ["AdminService", "get_admin_service", "templates"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from typing import List
 
@@ -18,8 +19,5 @@ class DataCheckRegistry:
         self._checks.append(check)
 
     async def run_all(self) -> list[DataCheckResult]:
-        results: list[DataCheckResult] = []
-        for check in self._checks:
-            result = await check()
-            results.append(result)
-        return results
+        # 各检查相互独立（DB 走 to_thread，Redis 原生 async），并发执行并保持注册顺序
+        return list(await asyncio.gather(*(check() for check in self._checks)))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 HttpMethod = Literal["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD"]
 
@@ -62,3 +62,6 @@ class DataCheckResult(BaseModel):
     detail: str
     suggestion: str | None = None
     checked_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+DATA_CHECK_LIST_ADAPTER = TypeAdapter(list[DataCheckResult])
@@ -4,6 +4,7 @@ import asyncio
 import json
 import warnings
 from collections import Counter, deque
+from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import mean
@@ -12,6 +13,7 @@ from typing import Any, Callable, Sequence
 from anyio import to_thread
 from app.admin.checks import CheckCallable, DataCheckRegistry
 from app.admin.schemas import (
+    DATA_CHECK_LIST_ADAPTER,
     ApiTestCase,
     ApiTestRequest,
     ApiTestResult,
@@ -31,18 +33,24 @@ from app.services.poi_service import get_poi_service
 from app.utils.http_client import perform_internal_request
 from app.utils.metrics import MetricsRegistry, get_metrics_registry
 from fastapi import FastAPI
+from pydantic import TypeAdapter
 from sqlalchemy import func, inspect, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import SAWarning, SQLAlchemyError
+from sqlalchemy.orm import defer
 
 APP_START_TIME = datetime.now(timezone.utc)
 ADMIN_DB_STATS_NS = "admin:db_stats"
 ADMIN_TRIP_SUMMARY_NS = "admin:trip_summary"
 ADMIN_DB_SCHEMA_NS = "admin:db_schema"
+ADMIN_HEALTH_NS = "admin:health"
+ADMIN_API_SUMMARY_NS = "admin:api_summary"
 ADMIN_DB_STATS_TTL = 60
 ADMIN_TRIP_SUMMARY_TTL = 60
 ADMIN_DB_SCHEMA_TTL = 180
+ADMIN_HEALTH_TTL = 3
+ADMIN_API_SUMMARY_TTL = 3
 LOG_TAIL_LIMIT = 120
 ERROR_TAIL_LIMIT = 60
 
@@ -76,6 +84,11 @@ PREDEFINED_TESTS: Sequence[ApiTestCase] = [
     ),
 ]
 
+# Static presets: dump them once at import rather than per request.
+PREDEFINED_TEST_PAYLOADS: tuple[dict[str, Any], ...] = tuple(
+    TypeAdapter(list[ApiTestCase]).dump_python(list(PREDEFINED_TESTS), mode="json")
+)
+
 CORE_TABLES: tuple[str, ...] = (
     "users",
     "trips",
@@ -112,6 +125,9 @@ class AdminService:
     def get_predefined_testcases(self) -> Sequence[ApiTestCase]:
         return PREDEFINED_TESTS
 
+    def get_predefined_testcase_payloads(self) -> Sequence[dict[str, Any]]:
+        return PREDEFINED_TEST_PAYLOADS
+
     def register_check(self, check: CheckCallable) -> None:
         """Allow later stages to plug in custom data checks."""
 
@@ -168,27 +184,40 @@ class AdminService:
         self.register_check(self._build_alembic_check)
 
     async def get_dashboard_context(self, app: FastAPI) -> dict[str, Any]:
-        basic_info = self.get_basic_info()
-        current_time = datetime.now(timezone.utc)
-        (
-            health,
-            data_checks,
-            db_stats,
-            trip_summary,
-            db_schema,
-        ) = await asyncio.gather(
+        probes = asyncio.gather(
             self.get_health_summary(),
             self.list_data_checks(),
             self.get_db_stats(),
             self.get_trip_summary(),
             self.get_db_schema_overview(),
+            self.get_api_summary(),
         )
-        api_summary = await self.get_api_summary()
-        ai_summary = self.get_ai_summary()
-        api_routes = self.get_api_routes(app)
-        api_components = self.get_api_schemas(app)
-        recent_logs = self.get_recent_logs(limit=LOG_TAIL_LIMIT)
-        recent_errors = self.get_recent_logs(limit=ERROR_TAIL_LIMIT, errors_only=True)
+        # 让出一次事件循环，使探针先把阻塞 I/O 派发到线程池，再组装本地上下文
+        try:
+            await asyncio.sleep(0)
+            basic_info = self.get_basic_info()
+            current_time = datetime.now(timezone.utc)
+            ai_summary = self.get_ai_summary()
+            api_routes = self.get_api_routes(app)
+            api_components = self.get_api_schemas(app)
+            recent_logs = self.get_recent_logs(limit=LOG_TAIL_LIMIT)
+            recent_errors = self.get_recent_logs(
+                limit=ERROR_TAIL_LIMIT, errors_only=True
+            )
+        except BaseException:
+            # 本地组装失败：取消并回收探针，避免孤儿任务与 "never retrieved" 告警
+            probes.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await probes
+            raise
+        (
+            health,
+            data_checks,
+            db_stats,
+            trip_summary,
+            db_schema,
+            api_summary,
+        ) = await probes
         db_health = health.get("db") or {
             "status": "unknown",
             "engine_url": self._redact_db_url(settings.database_url),
@@ -210,19 +239,30 @@ class AdminService:
             "recent_logs": recent_logs,
             "recent_errors": recent_errors,
             "log_directory": str(self._log_dir),
-            "checks": [check.model_dump(mode="json") for check in data_checks],
-            "predefined_tests": [
-                case.model_dump(mode="json") for case in self.get_predefined_testcases()
-            ],
+            "checks": DATA_CHECK_LIST_ADAPTER.dump_python(data_checks, mode="json"),
+            "predefined_tests": self.get_predefined_testcase_payloads(),
         }
 
     async def get_api_summary(
         self,
         window_seconds: int | None = None,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
-        if window_seconds:
-            return self._metrics_registry.snapshot_window(window_seconds)
-        return self._metrics_registry.snapshot()
+        async def _loader() -> dict[str, Any]:
+            if window_seconds:
+                return self._metrics_registry.snapshot_window(window_seconds)
+            return self._metrics_registry.snapshot()
+
+        if not use_cache:
+            return await _loader()
+
+        # 在事件循环上：用 remember_async，避免同步 singleflight 等待阻塞整个 loop
+        return await cache_backend.remember_async(
+            ADMIN_API_SUMMARY_NS,
+            str(window_seconds or "all"),
+            ADMIN_API_SUMMARY_TTL,
+            _loader,
+        )
 
     def get_ai_summary(self) -> dict[str, Any]:
         return self._ai_metrics.snapshot()
@@ -266,7 +306,8 @@ class AdminService:
             for key in ("queued", "running", "succeeded", "failed", "canceled"):
                 status_counts.setdefault(key, 0)
 
-            recent_query = session.query(AiTask)
+            # 列表只用到 payload 的几个键，result_json（整份行程）延迟加载
+            recent_query = session.query(AiTask).options(defer(AiTask.result))
             if kind_expr is not None:
                 recent_query = recent_query.filter(kind_expr)
             tasks = recent_query.order_by(AiTask.created_at.desc()).limit(limit).all()
@@ -434,7 +475,17 @@ class AdminService:
             for row in rows
         ]
 
-    def get_api_routes(self, app: FastAPI) -> list[dict[str, Any]]:
+    def get_api_routes(
+        self, app: FastAPI, *, refresh: bool = False
+    ) -> list[dict[str, Any]]:
+        cached = getattr(app.state, "admin_api_routes", None)
+        if cached is not None and not refresh:
+            return cached
+        routes = self._build_api_routes(app)
+        app.state.admin_api_routes = routes
+        return routes
+
+    def _build_api_routes(self, app: FastAPI) -> list[dict[str, Any]]:
         schema = app.openapi()
         paths: dict[str, Any] = schema.get("paths", {})
         routes: list[dict[str, Any]] = []
@@ -486,20 +537,41 @@ class AdminService:
         )
         return routes
 
-    def get_api_schemas(self, app: FastAPI) -> dict[str, Any]:
+    def get_api_schemas(self, app: FastAPI, *, refresh: bool = False) -> dict[str, Any]:
+        cached = getattr(app.state, "admin_api_schemas", None)
+        if cached is not None and not refresh:
+            return cached
         schema = app.openapi()
         components = schema.get("components", {})
-        return {
+        schemas = {
             "schemas": components.get("schemas", {}),
             "parameters": components.get("parameters", {}),
         }
+        app.state.admin_api_schemas = schemas
+        return schemas
 
-    async def get_health_summary(self) -> dict[str, Any]:
-        db, redis_state = await asyncio.gather(
-            self.get_db_health(),
-            check_redis_health(),
+    async def get_health_summary(self, use_cache: bool = True) -> dict[str, Any]:
+        async def _loader() -> dict[str, Any]:
+            db, redis_state = await asyncio.gather(
+                self.get_db_health(),
+                check_redis_health(),
+                return_exceptions=True,
+            )
+            return {
+                "app": "ok",
+                "db": _probe_result(db),
+                "redis": _probe_result(redis_state),
+            }
+
+        if not use_cache:
+            return await _loader()
+
+        return await cache_backend.remember_async(
+            ADMIN_HEALTH_NS,
+            "default",
+            ADMIN_HEALTH_TTL,
+            _loader,
         )
-        return {"app": "ok", "db": db, "redis": redis_state}
 
     async def get_db_health(self) -> dict[str, Any]:
         status = await check_db_health()
@@ -728,6 +800,9 @@ class AdminService:
             _loader,
         )
 
+    def invalidate_db_schema_cache(self) -> None:
+        cache_backend.invalidate(ADMIN_DB_SCHEMA_NS)
+
     async def _collect_table_counts(self) -> dict[str, dict[str, Any]]:
         def _run() -> dict[str, dict[str, Any]]:
             engine = get_engine()
@@ -1076,6 +1151,12 @@ class AdminService:
         )
 
 
+def _probe_result(result: Any) -> dict[str, Any]:
+    if isinstance(result, BaseException):
+        return {"status": "fail", "error": str(result)}
+    return result
+
+
 def _format_iso(value: Any) -> str | None:
     if value is None:
         return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Literal
 
@@ -83,7 +84,9 @@ class AiChatResult(BaseModel):
     finished_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-class AiStreamChunk(BaseModel):
+# 每个 token 都会构造一次，用轻量 dataclass 代替 BaseModel 校验
+@dataclass(slots=True)
+class AiStreamChunk:
     trace_id: str
     delta: str
     index: int
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass
+from threading import Lock
+from types import MappingProxyType
 
 from app.core.db import session_scope
 from app.core.logging import get_logger
 from app.core.settings import settings
 from app.models.ai_schemas import PromptSchema, PromptUpdatePayload
 from app.models.orm import AiPrompt
+from sqlalchemy import select
+from sqlalchemy.orm import load_only
 
 
 @dataclass(slots=True)
@@ -20,7 +26,7 @@ class PromptTemplate:
     tags: list[str] | None = None
 
 
-DEFAULT_PROMPTS: dict[str, PromptTemplate] = {
+_DEFAULT_PROMPTS: dict[str, PromptTemplate] = {
     "assistant.system.main": PromptTemplate(
         key="assistant.system.main",
         title="助手主提示词",
@@ -78,27 +84,53 @@ DEFAULT_PROMPTS: dict[str, PromptTemplate] = {
         ),
     ),
 }
+DEFAULT_PROMPTS: Mapping[str, PromptTemplate] = MappingProxyType(_DEFAULT_PROMPTS)
+
+# PromptSchema copies list fields on validation, so one shared default is safe.
+_EMPTY_TAGS: list[str] = []
+
+# Columns consumed by ``PromptRegistry._row_to_schema``; skips id/created_at.
+_PROMPT_SCHEMA_COLUMNS = (
+    AiPrompt.key,
+    AiPrompt.title,
+    AiPrompt.role,
+    AiPrompt.content,
+    AiPrompt.version,
+    AiPrompt.tags,
+    AiPrompt.is_active,
+    AiPrompt.updated_at,
+    AiPrompt.updated_by,
+)
 
 
 class PromptRegistry:
     """Unified prompt storage with DB overrides and in-memory cache."""
 
-    def __init__(self, cache_ttl: int = 60) -> None:
+    def __init__(self, cache_ttl: int = 60, max_entries: int = 256) -> None:
         self._cache_ttl = max(cache_ttl, 1)
-        self._cache: dict[str, tuple[float, PromptSchema]] = {}
+        self._max_entries = max(max_entries, 1)
+        self._cache: OrderedDict[str, tuple[float, PromptSchema]] = OrderedDict()
+        self._lock = Lock()
         self._logger = get_logger(__name__)
 
     def get_prompt(self, key: str) -> PromptSchema:
         now = time.monotonic()
-        cached = self._cache.get(key)
-        if cached and cached[0] > now:
-            return cached[1]
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._cache.move_to_end(key)
+                    return cached[1]
+                del self._cache[key]
 
         prompt = self._load_from_db(key) or self._load_default(key)
         if prompt is None:
             msg = f"prompt not found for key={key}"
             raise KeyError(msg)
-        self._cache[key] = (now + self._cache_ttl, prompt)
+        with self._lock:
+            self._cache[key] = (now + self._cache_ttl, prompt)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
         return prompt
 
     def list_prompts(self) -> list[PromptSchema]:
@@ -107,24 +139,14 @@ class PromptRegistry:
             prompts[key] = self._template_to_schema(template)
 
         with session_scope() as session:
-            rows = (
-                session.query(AiPrompt)
+            rows = session.execute(
+                select(AiPrompt)
+                .options(load_only(*_PROMPT_SCHEMA_COLUMNS))
                 .order_by(AiPrompt.updated_at.desc(), AiPrompt.version.desc())
-                .all()
-            )
+                .execution_options(yield_per=100)
+            ).scalars()
             for row in rows:
                 prompts[row.key] = self._row_to_schema(row)
-
-        for schema in prompts.values():
-            schema.default_content = DEFAULT_PROMPTS.get(
-                schema.key,
-                PromptTemplate(
-                    key=schema.key,
-                    title=schema.title,
-                    role=schema.role,
-                    content=schema.content,
-                ),
-            ).content
         return sorted(prompts.values(), key=lambda item: item.key)
 
     def reset_prompt(self, key: str) -> PromptSchema:
@@ -171,20 +193,21 @@ class PromptRegistry:
                     row.is_active = payload.is_active
             row.updated_by = payload.updated_by or row.updated_by
             session.commit()
-            session.refresh(row)
         self.invalidate(key)
         return self.get_prompt(key)
 
     def invalidate(self, key: str | None = None) -> None:
-        if key is None:
-            self._cache.clear()
-        else:
-            self._cache.pop(key, None)
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
 
     def _load_from_db(self, key: str) -> PromptSchema | None:
         with session_scope() as session:
             row = (
                 session.query(AiPrompt)
+                .options(load_only(*_PROMPT_SCHEMA_COLUMNS))
                 .filter(AiPrompt.key == key, AiPrompt.is_active.is_(True))
                 .order_by(AiPrompt.version.desc(), AiPrompt.updated_at.desc())
                 .first()
@@ -206,6 +229,7 @@ class PromptRegistry:
             tags = row.tags
         elif isinstance(row.tags, dict):
             tags = [f"{k}:{v}" for k, v in row.tags.items()]
+        default = DEFAULT_PROMPTS.get(row.key)
         return PromptSchema(
             key=row.key,
             title=row.title,
@@ -216,15 +240,7 @@ class PromptRegistry:
             is_active=bool(row.is_active),
             updated_at=row.updated_at,
             updated_by=row.updated_by,
-            default_content=DEFAULT_PROMPTS.get(
-                row.key,
-                PromptTemplate(
-                    key=row.key,
-                    title=row.title,
-                    role=row.role,
-                    content=row.content,
-                ),
-            ).content,
+            default_content=default.content if default else row.content,
         )
 
     @staticmethod
@@ -235,7 +251,7 @@ class PromptRegistry:
             role=template.role,
             content=template.content,
             version=template.version,
-            tags=list(template.tags) if template.tags else [],
+            tags=template.tags or _EMPTY_TAGS,
             is_active=True,
             updated_at=None,
             updated_by=None,
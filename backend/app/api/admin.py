@@ -1,32 +1,70 @@
 from __future__ import annotations
 
 # ruff: noqa: B008
+import re
 from datetime import datetime, timezone
+from typing import Any
 
-from app.admin import AdminService, get_admin_service, templates
+import orjson
+from anyio import to_thread
+from app.admin import get_admin_service, templates
 from app.admin.auth import AdminAuthError, verify_admin_access
-from app.admin.schemas import ApiTestRequest
+from app.admin.schemas import DATA_CHECK_LIST_ADAPTER, ApiTestRequest
 from app.ai.memory_models import MemoryLevel
-from app.core.db import get_db
+from app.core.db import get_session
 from app.core.logging import get_logger
 from app.core.settings import settings
-from app.models.ai_schemas import PromptUpdatePayload
+from app.models.ai_schemas import PromptSchema, PromptUpdatePayload
 from app.services.memory_service import get_memory_service
-from app.utils.responses import error_response, success_response
+from app.utils.responses import (
+    ORJSONResponse,
+    error_response,
+    success_json_response,
+    success_response,
+)
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
+from pydantic import TypeAdapter
 from sqlalchemy import text
-from sqlalchemy.orm import Session
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
+_SELECT_RE = re.compile(r"\s*select\b", re.IGNORECASE)
+_UTC = timezone.utc
+_VERSION = settings.app_version
+_PROMPT_LIST_ADAPTER = TypeAdapter(list[PromptSchema])
+_PING_HEAD, _PING_TAIL = orjson.dumps(
+    success_response({"version": _VERSION, "time": "__TIME__"})
+).split(b"__TIME__")
+_BASE_URL_CACHE_MAX = 16
+
+
+def _cached_base_url(request: Request) -> str:
+    # base_url 由 scheme/host/root_path 决定，按 app 缓存，避免每次重建 URL
+    cache: dict[tuple, str] | None = getattr(
+        request.app.state, "admin_base_url_cache", None
+    )
+    if cache is None:
+        cache = request.app.state.admin_base_url_cache = {}
+    key = (
+        request.scope.get("scheme"),
+        request.headers.get("host"),
+        request.scope.get("root_path", ""),
+    )
+    base_url = cache.get(key)
+    if base_url is None:
+        base_url = str(request.base_url)
+        if len(cache) < _BASE_URL_CACHE_MAX:
+            cache[key] = base_url
+    return base_url
+
 
 async def admin_auth_exception_handler(
     request: Request,
     exc: AdminAuthError,
-) -> JSONResponse:
-    return JSONResponse(
+) -> ORJSONResponse:
+    return ORJSONResponse(
         status_code=401,
         content=error_response(exc.message, code=2001),
     )
@@ -37,12 +75,12 @@ async def admin_auth_exception_handler(
     summary="Admin 心跳",
     description="返回当前版本与服务器时间，可作为监控探活接口。",
 )
-def admin_ping() -> dict:
-    payload = {
-        "version": settings.app_version,
-        "time": datetime.now(tz=timezone.utc).isoformat(),
-    }
-    return success_response(payload)
+async def admin_ping() -> Response:
+    # 探活调用量最大：仅时间戳会变，其余 JSON 在导入时预先序列化
+    return Response(
+        content=_PING_HEAD + datetime.now(_UTC).isoformat().encode() + _PING_TAIL,
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -52,8 +90,8 @@ def admin_ping() -> dict:
 )
 async def admin_dashboard(
     request: Request,
-    admin_service: AdminService = Depends(get_admin_service),  # noqa: B008
 ) -> HTMLResponse:
+    admin_service = get_admin_service()
     context = await admin_service.get_dashboard_context(request.app)
     context["request"] = request
     # --- Fix: 注入 settings，供 base.html 使用 ---
@@ -83,20 +121,22 @@ async def admin_favicon() -> Response:
 @router.get("/api/routes", summary="列出 API 路由")
 async def admin_api_routes(
     request: Request,
-    admin_service: AdminService = Depends(get_admin_service),
+    refresh: bool = Query(default=False),
     _: None = Depends(verify_admin_access),
 ) -> dict:
-    routes = admin_service.get_api_routes(request.app)
+    admin_service = get_admin_service()
+    routes = admin_service.get_api_routes(request.app, refresh=refresh)
     return success_response({"routes": routes})
 
 
 @router.get("/api/schemas", summary="列出 API Schemas")
 async def admin_api_schemas(
     request: Request,
-    admin_service: AdminService = Depends(get_admin_service),
+    refresh: bool = Query(default=False),
     _: None = Depends(verify_admin_access),
 ) -> dict:
-    schemas = admin_service.get_api_schemas(request.app)
+    admin_service = get_admin_service()
+    schemas = admin_service.get_api_schemas(request.app, refresh=refresh)
     return success_response(schemas)
 
 
@@ -104,10 +144,10 @@ async def admin_api_schemas(
 async def admin_db_schema(
     request: Request,
     view: int | None = Query(default=None),
-    admin_service: AdminService = Depends(get_admin_service),
 ) -> Response:
-    # HTML 视图禁用缓存，确保最新结构
-    data = await admin_service.get_db_schema_overview(use_cache=not bool(view))
+    admin_service = get_admin_service()
+    # 表结构仅在迁移后变化：HTML/JSON 视图共用缓存；刷新走需鉴权的 POST 接口
+    data = await admin_service.get_db_schema_overview()
     if view:
         tables_dict = data.get("tables", {}) or {}
         tables = [{"name": name, **details} for name, details in tables_dict.items()]
@@ -119,11 +159,20 @@ async def admin_db_schema(
     return success_response(data)
 
 
+@router.post("/db/schema/refresh", summary="刷新数据库结构缓存")
+async def admin_db_schema_refresh(
+    _: None = Depends(verify_admin_access),
+) -> dict:
+    admin_service = get_admin_service()
+    admin_service.invalidate_db_schema_cache()
+    data = await admin_service.get_db_schema_overview()
+    return success_response(data)
+
+
 @router.post("/api/sql_test", summary="SQL 调试 (Restricted)")
-def run_sql_test(
+async def run_sql_test(
     payload: dict[str, str],
     request: Request,
-    db: Session = Depends(get_db),
     _: None = Depends(verify_admin_access),
 ):
     """
@@ -133,11 +182,11 @@ def run_sql_test(
     if not settings.admin_sql_console_enabled:
         raise HTTPException(404, "SQL console is disabled.")
 
-    query = payload.get("query", "").strip()
-    if not query:
+    query = payload.get("query", "")
+    if not query or query.isspace():
         raise HTTPException(400, "Empty query.")
 
-    if not query.lower().startswith("select"):
+    if not _SELECT_RE.match(query):
         raise HTTPException(400, "Only SELECT queries are allowed in this console.")
     if ";" in query:
         raise HTTPException(400, "Multiple statements are not allowed.")
@@ -159,11 +208,27 @@ def run_sql_test(
         raise HTTPException(400, "Dangerous SQL keywords are not allowed.")
 
     max_rows = max(int(settings.admin_sql_console_max_rows), 1)
-    if " limit " not in f" {lowered} ":
-        query = f"{query} LIMIT {max_rows}"
+    # 外层 LIMIT 多取一行，用于判断结果是否被截断
+    query = f"SELECT * FROM ({query}) AS _sub LIMIT {max_rows + 1}"
     timeout_ms = max(int(settings.admin_sql_console_timeout_ms), 100)
     timeout_ms = min(timeout_ms, 60_000)
 
+    def _execute() -> tuple[list[str], list[dict[str, Any]], bool]:
+        session = get_session()
+        try:
+            session.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+            result = session.execute(
+                text(query).execution_options(
+                    stream_results=True, yield_per=max_rows + 1
+                )
+            )
+            keys = list(result.keys())
+            rows = result.mappings().fetchmany(max_rows + 1)
+            result.close()
+            return keys, [dict(row) for row in rows[:max_rows]], len(rows) > max_rows
+        finally:
+            session.close()
+
     try:
         logger.info(
             "admin.sql_test",
@@ -174,20 +239,14 @@ def run_sql_test(
                 "query_len": len(query),
             },
         )
-        db.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
-        result = db.execute(text(query))
-        keys = list(result.keys())
-        rows = result.fetchall()
-
-        # Convert rows to dicts
-        data = [dict(zip(keys, row, strict=False)) for row in rows]
-
+        keys, data, truncated = await to_thread.run_sync(_execute)
         return success_response(
             {
                 "columns": keys,
-                "rows": data[:max_rows],
+                "rows": data,
                 "count": len(data),
                 "limit": max_rows,
+                "truncated": truncated,
             }
         )
     except Exception as exc:
@@ -195,7 +254,7 @@ def run_sql_test(
             "admin.sql_test_failed",
             extra={"error": str(exc)},
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content=error_response(
                 "SQL execution failed.",
@@ -209,50 +268,45 @@ def run_sql_test(
 
 
 @router.get("/checks")
-async def admin_checks(
-    admin_service: AdminService = Depends(get_admin_service),
-) -> dict:
+async def admin_checks() -> Response:
+    admin_service = get_admin_service()
     checks = await admin_service.list_data_checks()
-    return success_response(checks)
+    return success_json_response(DATA_CHECK_LIST_ADAPTER.dump_json(checks))
 
 
 @router.get("/db/status")
-async def admin_db_status(
-    admin_service: AdminService = Depends(get_admin_service),
-) -> dict:
+async def admin_db_status() -> dict:
+    admin_service = get_admin_service()
     status = await admin_service.get_db_status()
     return success_response(status)
 
 
 @router.get("/poi/summary")
 async def admin_poi_summary(
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> dict:
+    admin_service = get_admin_service()
     summary = await admin_service.get_poi_summary()
     return success_response(summary)
 
 
 @router.get("/redis/status")
-async def admin_redis_status(
-    admin_service: AdminService = Depends(get_admin_service),
-) -> dict:
+async def admin_redis_status() -> dict:
+    admin_service = get_admin_service()
     status = await admin_service.get_redis_status()
     return success_response(status)
 
 
 @router.get("/db/health")
-async def admin_db_health(
-    admin_service: AdminService = Depends(get_admin_service),
-) -> dict:
+async def admin_db_health() -> dict:
+    admin_service = get_admin_service()
     status = await admin_service.get_db_health()
     return success_response(status)
 
 
 @router.get("/trips/summary")
-async def admin_trip_summary(
-    admin_service: AdminService = Depends(get_admin_service),
-) -> dict:
+async def admin_trip_summary() -> dict:
+    admin_service = get_admin_service()
     summary = await admin_service.get_trip_summary(use_cache=False)
     return success_response(summary)
 
@@ -260,44 +314,43 @@ async def admin_trip_summary(
 @router.get("/api/summary")
 async def admin_api_summary(
     window: int | None = Query(default=None, ge=1),
-    admin_service: AdminService = Depends(get_admin_service),
 ) -> dict:
+    admin_service = get_admin_service()
     summary = await admin_service.get_api_summary(window_seconds=window)
     return success_response(summary)
 
 
 @router.get("/api/testcases")
 async def admin_api_testcases(
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> dict:
-    testcases = [case.model_dump() for case in admin_service.get_predefined_testcases()]
-    return success_response(testcases)
+    admin_service = get_admin_service()
+    return success_response(admin_service.get_predefined_testcase_payloads())
 
 
 @router.post("/api/test")
 async def admin_api_test(
     payload: ApiTestRequest,
     request: Request,
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> dict:
+    admin_service = get_admin_service()
     try:
         result = await admin_service.run_api_test(
-            payload, request.app, str(request.base_url)
+            payload, request.app, _cached_base_url(request)
         )
     except ValueError as exc:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400, content=error_response(str(exc), code=14020)
         )
     return success_response(result)
 
 
 @router.get("/ai/summary")
-def admin_ai_summary_data(
-    admin_service: AdminService = Depends(get_admin_service),
+async def admin_ai_summary_data(
     _: None = Depends(verify_admin_access),
 ) -> dict:
+    admin_service = get_admin_service()
     summary = admin_service.get_ai_summary()
     return success_response(summary)
 
@@ -306,9 +359,9 @@ def admin_ai_summary_data(
 def admin_ai_tasks_summary_data(
     kind: str | None = Query(default="plan:deep"),
     limit: int = Query(default=20, ge=1, le=200),
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> dict:
+    admin_service = get_admin_service()
     summary = admin_service.get_ai_tasks_summary(kind=kind, limit=limit)
     return success_response(summary)
 
@@ -317,9 +370,9 @@ def admin_ai_tasks_summary_data(
 async def admin_ai_tasks_page(
     request: Request,
     kind: str | None = Query(default="plan:deep"),
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> HTMLResponse:
+    admin_service = get_admin_service()
     summary = admin_service.get_ai_tasks_summary(kind=kind, limit=20)
     context = {
         "request": request,
@@ -335,9 +388,9 @@ async def admin_ai_tasks_page(
 
 @router.get("/plan/summary")
 def admin_plan_summary_data(
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> dict:
+    admin_service = get_admin_service()
     summary = admin_service.get_plan_summary()
     return success_response(summary)
 
@@ -345,9 +398,9 @@ def admin_plan_summary_data(
 @router.get("/plan/overview", response_class=HTMLResponse)
 async def admin_plan_overview(
     request: Request,
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> HTMLResponse:
+    admin_service = get_admin_service()
     summary = admin_service.get_plan_summary()
     context = {
         "request": request,
@@ -363,64 +416,64 @@ async def admin_plan_overview(
 
 @router.get("/chat/summary")
 def admin_chat_summary_data(
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> dict:
+    admin_service = get_admin_service()
     summary = admin_service.get_chat_summary()
     return success_response(summary)
 
 
 @router.get("/api/prompts")
 async def admin_prompt_list(
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ):
+    admin_service = get_admin_service()
     prompts = admin_service.list_prompts()
-    return success_response([item.model_dump(mode="json") for item in prompts])
+    return success_json_response(_PROMPT_LIST_ADAPTER.dump_json(prompts))
 
 
 @router.get("/api/prompts/{key}")
 async def admin_prompt_detail(
     key: str,
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ):
+    admin_service = get_admin_service()
     try:
         prompt = admin_service.get_prompt_detail(key)
     except KeyError:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404, content=error_response("Prompt 不存在", code=24004)
         )
-    return success_response(prompt.model_dump(mode="json"))
+    return success_json_response(prompt.model_dump_json().encode())
 
 
 @router.put("/api/prompts/{key}")
 async def admin_prompt_update(
     key: str,
     payload: PromptUpdatePayload,
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ):
+    admin_service = get_admin_service()
     updated = admin_service.update_prompt(key, payload)
-    return success_response(updated.model_dump(mode="json"))
+    return success_json_response(updated.model_dump_json().encode())
 
 
 @router.post("/api/prompts/{key}/reset")
 async def admin_prompt_reset(
     key: str,
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ):
+    admin_service = get_admin_service()
     prompt = admin_service.reset_prompt(key)
-    return success_response(prompt.model_dump(mode="json"))
+    return success_json_response(prompt.model_dump_json().encode())
 
 
 @router.get("/ai/console", response_class=HTMLResponse)
 async def admin_ai_console(
     request: Request,
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> HTMLResponse:
+    admin_service = get_admin_service()
     context = admin_service.get_ai_console_context()
     context["request"] = request
     # --- Fix: 注入 settings，供 base.html 使用 ---
@@ -436,9 +489,9 @@ async def admin_ai_console(
 @router.get("/ai/prompts", response_class=HTMLResponse)
 async def admin_ai_prompts(
     request: Request,
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> HTMLResponse:
+    admin_service = get_admin_service()
     context = {
         "request": request,
         "settings": settings,
@@ -495,17 +548,15 @@ async def admin_ai_memories(
 
 
 @router.get("/health")
-async def admin_health(
-    admin_service: AdminService = Depends(get_admin_service),
-) -> dict:
+async def admin_health() -> dict:
+    admin_service = get_admin_service()
     health = await admin_service.get_health_summary()
     return success_response(health)
 
 
 @router.get("/db/stats")
-async def admin_db_stats(
-    admin_service: AdminService = Depends(get_admin_service),
-) -> dict:
+async def admin_db_stats() -> dict:
+    admin_service = get_admin_service()
     stats = await admin_service.get_db_stats()
     return success_response(stats)
 
@@ -513,9 +564,9 @@ async def admin_db_stats(
 @router.get("/poi/overview", response_class=HTMLResponse)
 async def admin_poi_overview(
     request: Request,
-    admin_service: AdminService = Depends(get_admin_service),
     _: None = Depends(verify_admin_access),
 ) -> HTMLResponse:
+    admin_service = get_admin_service()
     summary = await admin_service.get_poi_summary()
     context = {
         "request": request,
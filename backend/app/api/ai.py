@@ -1,26 +1,66 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
+import logging
+import os
+import secrets
 from contextlib import suppress
-from uuid import uuid4
+from typing import Any
 
+import orjson
 from app.ai import AiClientError, AiStreamChunk
 from app.core.logging import get_logger
-from app.models.ai_schemas import ChatDemoPayload, ChatPayload
-from app.models.plan_schemas import PlanRequest
+from app.models.ai_schemas import (
+    ChatDemoPayload,
+    ChatDemoResult,
+    ChatPayload,
+    ChatResult,
+)
+from app.models.plan_schemas import PlanRequest, PlanResponseData, PlanTaskSchema
 from app.services.ai_chat_service import AiChatDemoService, get_ai_chat_service
 from app.services.assistant_service import AssistantService, get_assistant_service
 from app.services.plan_service import PlanServiceError, get_plan_service
 from app.services.plan_task_service import PlanTaskServiceError, get_plan_task_service
 from app.utils.api_errors import format_exception
-from app.utils.responses import error_response, success_response
-from app.utils.sse import sse_data, sse_done
+from app.utils.responses import (
+    ORJSONResponse,
+    error_response,
+    success_json_response,
+)
+from app.utils.sse import SSE_DONE, sse_data, sse_done
 from fastapi import APIRouter, Query, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-router = APIRouter(prefix="/api/ai", tags=["ai"])
+router = APIRouter(prefix="/api/ai", tags=["ai"], default_response_class=ORJSONResponse)
 LOGGER = get_logger(__name__)
 
+_PLAN_RESPONSE_ADAPTER = TypeAdapter(PlanResponseData)
+_PLAN_TASK_ADAPTER = TypeAdapter(PlanTaskSchema)
+_CHAT_DEMO_RESULT_ADAPTER = TypeAdapter(ChatDemoResult)
+_CHAT_RESULT_ADAPTER = TypeAdapter(ChatResult)
+
+# 进程内唯一即可：随机前缀 + pid 区分 worker，计数器避免每次 urandom。
+# 预加载（gunicorn --preload）时 worker 继承父进程的前缀与计数器，fork 后须重置
+_RID_PREFIX = ""
+_RID_COUNTER = itertools.count(1)
+
+
+def _reset_request_ids() -> None:
+    global _RID_PREFIX, _RID_COUNTER
+    _RID_PREFIX = f"{secrets.token_hex(4)}{os.getpid():x}"
+    _RID_COUNTER = itertools.count(1)
+
+
+_reset_request_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_request_ids)
+
+
+def _new_request_id(kind: str) -> str:
+    return f"{kind}-{_RID_PREFIX}-{next(_RID_COUNTER):x}"
+
 
 def _demo_service() -> AiChatDemoService:
     return get_ai_chat_service()
@@ -30,6 +70,18 @@ def _assistant_service() -> AssistantService:
     return get_assistant_service()
 
 
+def _service_error_response(
+    exc: PlanServiceError | PlanTaskServiceError, *, status_code: int = 400
+) -> ORJSONResponse:
+    data: dict[str, Any] = {"trace_id": exc.trace_id}
+    if exc.data:
+        data.update(exc.data)
+    return ORJSONResponse(
+        status_code=status_code,
+        content=error_response(exc.message, code=exc.code, data=data),
+    )
+
+
 @router.post(
     "/plan",
     summary="行程规划（fast/deep 统一入口）",
@@ -43,34 +95,24 @@ async def plan(payload: PlanRequest):
         try:
             result = task_service.enqueue_deep_task(payload)
         except PlanTaskServiceError as exc:
-            return JSONResponse(
-                status_code=400,
-                content=error_response(
-                    exc.message,
-                    code=exc.code,
-                    data={"trace_id": exc.trace_id, **(exc.data or {})},
-                ),
-            )
-        return success_response(result.model_dump(mode="json", by_alias=True))
+            return _service_error_response(exc)
+        return success_json_response(
+            _PLAN_RESPONSE_ADAPTER.dump_json(result, by_alias=True)
+        )
 
     service = get_plan_service()
     try:
         result, _trip_id = await service.plan(payload)
     except PlanServiceError as exc:
-        return JSONResponse(
-            status_code=400,
-            content=error_response(
-                exc.message,
-                code=exc.code,
-                data={"trace_id": exc.trace_id, **(exc.data or {})},
-            ),
-        )
+        return _service_error_response(exc)
     except Exception as exc:  # pragma: no cover - defensive
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=502,
             content=error_response("规划失败", code=14079, data={"error": str(exc)}),
         )
-    return success_response(result.model_dump(mode="json", by_alias=True))
+    return success_json_response(
+        _PLAN_RESPONSE_ADAPTER.dump_json(result, by_alias=True)
+    )
 
 
 @router.get(
@@ -88,19 +130,12 @@ async def get_plan_task(
         task = service.get_task(task_id, request=request, user_id=user_id)
     except PlanTaskServiceError as exc:
         status = 404 if exc.code == 14084 else 400
-        return JSONResponse(
-            status_code=status,
-            content=error_response(
-                exc.message,
-                code=exc.code,
-                data={"trace_id": exc.trace_id, **(exc.data or {})},
-            ),
-        )
-    return success_response(task.model_dump(mode="json", by_alias=True))
+        return _service_error_response(exc, status_code=status)
+    return success_json_response(_PLAN_TASK_ADAPTER.dump_json(task, by_alias=True))
 
 
-async def _enqueue_sse_chunk(queue: asyncio.Queue[str], chunk: AiStreamChunk) -> None:
-    if not chunk.delta and not chunk.done:
+async def _enqueue_sse_chunk(queue: asyncio.Queue[bytes], chunk: AiStreamChunk) -> None:
+    if not (chunk.delta or chunk.done):
         return
     event = {
         "event": "chunk",
@@ -109,15 +144,37 @@ async def _enqueue_sse_chunk(queue: asyncio.Queue[str], chunk: AiStreamChunk) ->
         "delta": chunk.delta,
         "done": chunk.done,
     }
-    await queue.put(sse_data(event))
+    frame = sse_data(event)
+    try:
+        queue.put_nowait(frame)
+    except asyncio.QueueFull:
+        # 客户端读得慢时反压上游；长时间不消费视为连接卡死，中止生成
+        await asyncio.wait_for(queue.put(frame), timeout=_SSE_PUT_TIMEOUT_S)
+
+
+def _offer_sse_frame(queue: asyncio.Queue[bytes], frame: bytes) -> None:
+    # 收尾帧不等待：队列已满说明客户端卡住，丢弃即可，_event_stream 会随 producer 结束
+    with suppress(asyncio.QueueFull):
+        queue.put_nowait(frame)
 
 
-async def _event_stream(queue: asyncio.Queue[str], producer_task: asyncio.Task):
+_SSE_BATCH_MAX = 16
+_SSE_QUEUE_MAXSIZE = 256
+_SSE_PUT_TIMEOUT_S = 30.0
+
+
+async def _event_stream(queue: asyncio.Queue[bytes], producer_task: asyncio.Task):
     try:
         while True:
-            chunk = await queue.get()
-            yield chunk
-            if chunk.strip().endswith("[DONE]"):
+            # 已排队的帧合并成一次写出，快速模型下可显著减少 ASGI send 次数
+            if queue.empty() and producer_task.done():
+                # 收尾帧未能入队（客户端读得太慢），producer 已退出
+                break
+            batch = [await queue.get()]
+            while len(batch) < _SSE_BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+            yield b"".join(batch)
+            if batch[-1] is SSE_DONE:
                 break
     finally:
         if not producer_task.done():
@@ -140,11 +197,11 @@ async def chat_demo(payload: ChatDemoPayload):
         result = await service.run_chat(payload)
     except AiClientError as exc:
         data = {"trace_id": exc.trace_id, "error_type": exc.type}
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=502,
             content=error_response("AI 调用失败", code=3001, data=data),
         )
-    return success_response(result.model_dump(mode="json"))
+    return success_json_response(_CHAT_DEMO_RESULT_ADAPTER.dump_json(result))
 
 
 @router.post(
@@ -153,32 +210,34 @@ async def chat_demo(payload: ChatDemoPayload):
     description="支持 session_id 的多轮对话，行程查询与记忆读写，支持流式输出。",
 )
 async def chat(payload: ChatPayload):
-    request_id = f"chat-{uuid4().hex}"
-    LOGGER.info(
-        "ai.chat.request",
-        extra={
-            "request_id": request_id,
-            "user_id": payload.user_id,
-            "trip_id": payload.trip_id,
-            "session_id": payload.session_id,
-            "stream": payload.stream,
-        },
-    )
+    request_id = _new_request_id("chat")
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(
+            "ai.chat.request",
+            extra={
+                "request_id": request_id,
+                "user_id": payload.user_id,
+                "trip_id": payload.trip_id,
+                "session_id": payload.session_id,
+                "stream": payload.stream,
+            },
+        )
     service = _assistant_service()
     if payload.stream:
         return await _stream_assistant(service, payload, request_id=request_id)
     try:
         result = await service.run_chat(payload)
     except ValueError as exc:
-        LOGGER.warning(
-            "ai.chat.bad_request",
-            extra={
-                "error": str(exc),
-                "user_id": payload.user_id,
-                "trip_id": payload.trip_id,
-            },
-        )
-        return JSONResponse(
+        if LOGGER.isEnabledFor(logging.WARNING):
+            LOGGER.warning(
+                "ai.chat.bad_request",
+                extra={
+                    "error": str(exc),
+                    "user_id": payload.user_id,
+                    "trip_id": payload.trip_id,
+                },
+            )
+        return ORJSONResponse(
             status_code=400,
             content=error_response(str(exc), code=14030),
         )
@@ -194,7 +253,7 @@ async def chat(payload: ChatPayload):
                 "session_id": payload.session_id,
             },
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=502,
             content=error_response(
                 "AI 调用失败",
@@ -206,15 +265,15 @@ async def chat(payload: ChatPayload):
                 },
             ),
         )
-    return success_response(result.model_dump(mode="json"))
+    return success_json_response(_CHAT_RESULT_ADAPTER.dump_json(result))
 
 
 async def _stream_chat(
     service: AiChatDemoService,
     payload: ChatDemoPayload,
 ) -> StreamingResponse:
-    queue: asyncio.Queue[str] = asyncio.Queue()
-    request_id = f"chat-demo-{uuid4().hex}"
+    queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=_SSE_QUEUE_MAXSIZE)
+    request_id = _new_request_id("chat-demo")
 
     async def on_chunk(chunk: AiStreamChunk) -> None:
         await _enqueue_sse_chunk(queue, chunk)
@@ -222,17 +281,19 @@ async def _stream_chat(
     async def producer() -> None:
         try:
             result = await service.run_chat(payload, stream_handler=on_chunk)
-            await queue.put(
-                sse_data(
-                    {
-                        "event": "result",
-                        "request_id": request_id,
-                        "payload": result.model_dump(mode="json"),
-                    }
-                )
+            frame = sse_data(
+                {
+                    "event": "result",
+                    "request_id": request_id,
+                    "payload": orjson.Fragment(
+                        _CHAT_DEMO_RESULT_ADAPTER.dump_json(result)
+                    ),
+                }
             )
+            await asyncio.wait_for(queue.put(frame), timeout=_SSE_PUT_TIMEOUT_S)
         except AiClientError as exc:
-            await queue.put(
+            _offer_sse_frame(
+                queue,
                 sse_data(
                     {
                         "event": "error",
@@ -241,10 +302,34 @@ async def _stream_chat(
                         "message": exc.message,
                         "ai_trace_id": exc.trace_id,
                     }
-                )
+                ),
+            )
+        except Exception as exc:
+            # 含客户端长时间不读导致的 TimeoutError：记录后结束流，不留悬挂任务
+            detail = format_exception(exc, request_id=request_id)
+            LOGGER.warning(
+                "ai.chat_demo_stream.failed",
+                extra={
+                    "request_id": request_id,
+                    "error_type": detail.error_type,
+                    "error": detail.detail,
+                    "user_id": payload.user_id,
+                },
+            )
+            _offer_sse_frame(
+                queue,
+                sse_data(
+                    {
+                        "event": "error",
+                        "request_id": request_id,
+                        "error_type": detail.error_type,
+                        "message": "AI 调用失败",
+                        "detail": detail.detail,
+                    }
+                ),
             )
         finally:
-            await queue.put(sse_done())
+            _offer_sse_frame(queue, sse_done())
 
     producer_task = asyncio.create_task(producer())
     return StreamingResponse(
@@ -258,35 +343,35 @@ async def _stream_assistant(
     *,
     request_id: str,
 ) -> StreamingResponse:
-    queue: asyncio.Queue[str] = asyncio.Queue()
-    sse_error_id = f"sse-{uuid4().hex}"
+    sse_error_id = _new_request_id("sse")
 
-    async def on_chunk(chunk: AiStreamChunk) -> None:
-        # keep chunk.ai_trace_id from model, but attach request_id for debugging
-        if not chunk.delta and not chunk.done:
-            return
-        event = {
-            "event": "chunk",
-            "request_id": request_id,
-            "ai_trace_id": chunk.trace_id,
-            "index": chunk.index,
-            "delta": chunk.delta,
-            "done": chunk.done,
-        }
-        await queue.put(sse_data(event))
-
-    async def producer() -> None:
+    async def event_stream():
         try:
-            result = await service.run_chat(payload, stream_handler=on_chunk)
-            await queue.put(
-                sse_data(
+            async for item in service.run_chat_stream(payload):
+                if isinstance(item, ChatResult):
+                    yield sse_data(
+                        {
+                            "event": "result",
+                            "request_id": request_id,
+                            "payload": orjson.Fragment(
+                                _CHAT_RESULT_ADAPTER.dump_json(item)
+                            ),
+                        }
+                    )
+                    continue
+                # keep chunk.ai_trace_id from model, but attach request_id for debugging
+                if not (item.delta or item.done):
+                    continue
+                yield sse_data(
                     {
-                        "event": "result",
+                        "event": "chunk",
                         "request_id": request_id,
-                        "payload": result.model_dump(mode="json"),
+                        "ai_trace_id": item.trace_id,
+                        "index": item.index,
+                        "delta": item.delta,
+                        "done": item.done,
                     }
                 )
-            )
         except ValueError as exc:
             LOGGER.warning(
                 "ai.chat_stream.bad_request",
@@ -298,15 +383,13 @@ async def _stream_assistant(
                     "session_id": payload.session_id,
                 },
             )
-            await queue.put(
-                sse_data(
-                    {
-                        "event": "error",
-                        "request_id": request_id,
-                        "error_type": "bad_request",
-                        "message": str(exc),
-                    }
-                )
+            yield sse_data(
+                {
+                    "event": "error",
+                    "request_id": request_id,
+                    "error_type": "bad_request",
+                    "message": str(exc),
+                }
             )
         except Exception as exc:  # pragma: no cover - defensive
             detail = format_exception(exc, request_id=request_id)
@@ -320,26 +403,20 @@ async def _stream_assistant(
                     "session_id": payload.session_id,
                 },
             )
-            await queue.put(
-                sse_data(
-                    {
-                        "event": "error",
-                        "request_id": detail.request_id,
-                        "error_type": detail.error_type,
-                        "message": "AI 调用失败",
-                        "detail": detail.detail,
-                        "sse_error_id": sse_error_id,
-                    }
-                )
+            yield sse_data(
+                {
+                    "event": "error",
+                    "request_id": detail.request_id,
+                    "error_type": detail.error_type,
+                    "message": "AI 调用失败",
+                    "detail": detail.detail,
+                    "sse_error_id": sse_error_id,
+                }
             )
-        finally:
-            await queue.put(sse_done())
+        yield sse_done()
 
-    producer_task = asyncio.create_task(producer())
-    return StreamingResponse(
-        _event_stream(queue, producer_task), media_type="text/event-stream"
-    )
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
-def _format_sse(payload: dict) -> str:  # pragma: no cover - backward compat
+def _format_sse(payload: dict) -> bytes:  # pragma: no cover - backward compat
     return sse_data(payload)
@@ -1,11 +1,14 @@
+import orjson
 from app.utils.responses import success_response
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+_HEALTHZ_BODY = orjson.dumps(success_response({"status": "ok"}))
+
 
 @router.get("/healthz")
-def read_healthz() -> dict:
+async def read_healthz() -> Response:
     """Basic liveness probe endpoint."""
 
-    return success_response({"status": "ok"})
+    return Response(content=_HEALTHZ_BODY, media_type="application/json")
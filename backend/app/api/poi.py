@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from app.services.poi_service import PoiServiceError, get_poi_service
-from app.utils.responses import error_response, success_response
+from app.utils.responses import ORJSONResponse, error_response, success_response
 from fastapi import APIRouter, Query
-from fastapi.responses import JSONResponse
 
 router = APIRouter(prefix="/api/poi", tags=["poi"])
 
@@ -33,7 +32,7 @@ async def poi_around(
             lat=lat, lng=lng, poi_type=type, radius=radius, limit=limit or 20
         )
     except PoiServiceError as exc:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400, content=error_response(exc.message, code=14040)
         )
     return success_response({"items": results, "meta": meta})
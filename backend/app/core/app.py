@@ -1,9 +1,13 @@
-from app.admin.auth import AdminAuthError
-from app.api import admin, ai, health, poi, trips
+from app.api import ai, health, poi, trips
+from app.core.cache import cache_backend
 from app.core.logging import setup_logging
+from app.core.redis import close_async_redis_pools
 from app.core.settings import settings
+from app.services.assistant_service import get_assistant_service
+from app.services.plan_service import get_plan_service
 from app.services.plan_task_worker import get_plan_task_worker
 from app.utils.metrics import APIMetricsMiddleware
+from app.utils.responses import ORJSONResponse
 from fastapi import FastAPI
 
 
@@ -15,6 +19,7 @@ def create_app() -> FastAPI:
         title=settings.app_name,
         version=settings.app_version,
         debug=settings.debug,
+        default_response_class=ORJSONResponse,
     )
 
     application.add_middleware(APIMetricsMiddleware)
@@ -22,11 +27,22 @@ def create_app() -> FastAPI:
     application.include_router(trips.router)
     application.include_router(poi.router)
     application.include_router(ai.router)
-    application.include_router(admin.router, prefix="/admin", tags=["admin"])
-    application.add_exception_handler(
-        AdminAuthError,
-        admin.admin_auth_exception_handler,
-    )
+    if settings.admin_enabled:
+        # 纯用户流量实例可关闭管理端：不导入、不注册，路由表更短
+        from app.admin.auth import AdminAuthError
+        from app.api import admin
+
+        application.include_router(admin.router, prefix="/admin", tags=["admin"])
+        application.add_exception_handler(
+            AdminAuthError,
+            admin.admin_auth_exception_handler,
+        )
+
+    @application.on_event("startup")
+    async def _warm_planner_graphs() -> None:
+        # pydantic 校验器在导入时已构建；首个请求的冷启动开销在于编译规划/助手图
+        get_plan_service()
+        get_assistant_service()
 
     @application.on_event("startup")
     async def _start_plan_task_worker() -> None:
@@ -36,4 +52,9 @@ def create_app() -> FastAPI:
     async def _stop_plan_task_worker() -> None:
         await get_plan_task_worker().stop()
 
+    @application.on_event("shutdown")
+    async def _flush_cache_writes() -> None:
+        cache_backend.flush()
+        await close_async_redis_pools()
+
     return application
@@ -1,71 +1,190 @@
 from __future__ import annotations
 
-import inspect
+import asyncio
 import pickle
+import queue
 import warnings
-from dataclasses import dataclass
-from threading import RLock
-from time import monotonic
-from typing import Any, Awaitable, Callable, Dict
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import lru_cache
+from threading import Lock, RLock, Thread, get_ident
+from time import monotonic, time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping
 
+from app.core.logging import get_logger
 from app.core.settings import settings
 
 try:
+    from app.core.redis import get_async_redis_pool, get_redis_pool
     from redis import Redis
+    from redis.asyncio import Redis as AsyncRedis
     from redis.exceptions import RedisError
 except Exception:  # pragma: no cover - optional dependency
     Redis = None
+    AsyncRedis = None
     RedisError = Exception
 
+LOGGER = get_logger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class _CacheEntry:
     value: Any
     expires_at: float
 
 
+@dataclass
+class _CacheShard:
+    store: Dict[str, OrderedDict[str, _CacheEntry]] = field(default_factory=dict)
+    lock: RLock = field(default_factory=RLock)
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+
+_SHARD_COUNT = 16  # power of two, shard index is hash(namespace) & mask
+_SWEEP_EVERY = 256  # writes per shard between expired-entry sweeps
+_EXPIRE_PROBE = 20  # expired LRU-head entries dropped per write at most
+_REMEMBER_WAIT_SECONDS = 10.0  # max wait on another thread's loader in remember()
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class CacheBackend:
-    """In-memory TTL cache with namespace based invalidation."""
+    """In-memory TTL cache with namespace based invalidation.
+
+    Namespaces are spread over independently locked shards so that unrelated
+    callers (POI, plan, admin, ...) do not contend on a single lock. Each
+    namespace is a bounded LRU; expired entries are also swept periodically
+    so keys that are never read again do not pin memory.
+    """
 
-    def __init__(self) -> None:
-        self._store: Dict[str, Dict[str, _CacheEntry]] = {}
-        self._lock = RLock()
+    def __init__(self, max_entries_per_ns: int = 2048) -> None:
+        self._shards = tuple(_CacheShard() for _ in range(_SHARD_COUNT))
+        self._shard_mask = _SHARD_COUNT - 1
+        self._max_entries = max(max_entries_per_ns, 1)
+        self._init_inflight()
 
-    def _resolve(self, namespace: str) -> Dict[str, _CacheEntry]:
-        if namespace not in self._store:
-            self._store[namespace] = {}
-        return self._store[namespace]
+    def _init_inflight(self) -> None:
+        # singleflight：同一 key 未命中时只有一个调用方执行 loader，其余等待其结果
+        self._inflight_lock = Lock()
+        # value: (leader 的结果 Future, leader 线程 id)
+        self._inflight: dict[tuple[str, str], tuple[Future[Any], int]] = {}
+        self._inflight_async: dict[tuple[str, str], asyncio.Future[Any]] = {}
+
+    def _shard(self, namespace: str) -> _CacheShard:
+        return self._shards[hash(namespace) & self._shard_mask]
 
     def get(self, namespace: str, key: str) -> Any | None:
-        with self._lock:
-            bucket = self._store.get(namespace)
-            if not bucket:
-                return None
-            entry = bucket.get(key)
-            if not entry:
-                return None
-            if monotonic() >= entry.expires_at:
-                bucket.pop(key, None)
-                return None
-            return entry.value
+        # Reads take no lock: single dict/OrderedDict operations are atomic in
+        # CPython, writers hold the shard lock only to keep eviction consistent.
+        # A racing writer can at worst turn a hit into a miss; hit/miss counters
+        # are approximate for the same reason. The shard lookup is inlined:
+        # this is the hottest path and a method call costs more than the body.
+        shard = self._shards[hash(namespace) & self._shard_mask]
+        bucket = shard.store.get(namespace)
+        entry = bucket.get(key) if bucket else None
+        if entry is None:
+            shard.misses += 1
+            return None
+        if monotonic() >= entry.expires_at:
+            bucket.pop(key, None)
+            shard.misses += 1
+            return None
+        try:
+            bucket.move_to_end(key)
+        except KeyError:  # evicted or invalidated concurrently
+            pass
+        shard.hits += 1
+        return entry.value
 
     def set(self, namespace: str, key: str, value: Any, ttl_seconds: int) -> None:
-        expires_at = monotonic() + max(ttl_seconds, 1)
-        with self._lock:
-            bucket = self._resolve(namespace)
+        now = monotonic()
+        expires_at = now + max(ttl_seconds, 1)
+        shard = self._shards[hash(namespace) & self._shard_mask]
+        with shard.lock:
+            bucket = shard.store.get(namespace)
+            if bucket is None:
+                bucket = shard.store[namespace] = OrderedDict()
             bucket[key] = _CacheEntry(value=value, expires_at=expires_at)
+            bucket.move_to_end(key)
+            # 类似 Redis 主动过期：每次写入从 LRU 头部探测少量条目，过期即删，
+            # 遇到未过期条目就停，单次写入 O(1)；容量满时先腾出过期条目再淘汰。
+            # 无锁读会 move_to_end，不能迭代 bucket：用单次 popitem 取头部，
+            # 未过期则放回头部（其间并发读至多把一次命中变成未命中）
+            for _ in range(_EXPIRE_PROBE):
+                try:
+                    oldest_key, oldest = bucket.popitem(last=False)
+                except KeyError:  # 并发读已删光过期条目
+                    break
+                if oldest.expires_at > now:
+                    bucket[oldest_key] = oldest
+                    bucket.move_to_end(oldest_key, last=False)
+                    break
+            while len(bucket) > self._max_entries:
+                bucket.popitem(last=False)
+            shard.writes += 1
+            if shard.writes % _SWEEP_EVERY == 0:
+                self._sweep_expired(shard, now)
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> dict[str, Any]:
+        """Return the cached subset of ``keys``; misses are simply absent."""
+
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = self.get(namespace, key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(
+        self, namespace: str, items: Mapping[str, Any], ttl_seconds: int
+    ) -> None:
+        shard = self._shard(namespace)
+        with shard.lock:
+            for key, value in items.items():
+                self.set(namespace, key, value, ttl_seconds)
+
+    @staticmethod
+    def _sweep_expired(shard: _CacheShard, now: float) -> None:
+        for bucket in list(shard.store.values()):
+            # snapshot first: lock-free readers may touch the bucket meanwhile
+            for k, entry in list(bucket.items()):
+                if entry.expires_at <= now:
+                    bucket.pop(k, None)
 
     def invalidate(self, namespace: str, key: str | None = None) -> None:
-        with self._lock:
-            if namespace not in self._store:
-                return
+        shard = self._shard(namespace)
+        with shard.lock:
             if key is None:
-                self._store.pop(namespace, None)
+                shard.store.pop(namespace, None)
                 return
-            bucket = self._store.get(namespace)
+            bucket = shard.store.get(namespace)
             if bucket is not None:
                 bucket.pop(key, None)
 
+    def flush(self) -> None:
+        """Block until buffered writes are persisted (no-op in memory)."""
+
+    def stats(self) -> dict[str, int]:
+        hits = misses = entries = 0
+        for shard in self._shards:
+            with shard.lock:
+                hits += shard.hits
+                misses += shard.misses
+                entries += sum(len(bucket) for bucket in shard.store.values())
+        return {"hits": hits, "misses": misses, "entries": entries}
+
+    async def aget(self, namespace: str, key: str) -> Any | None:
+        return self.get(namespace, key)
+
     def remember(
         self,
         namespace: str,
@@ -76,50 +195,220 @@ class CacheBackend:
         cached = self.get(namespace, key)
         if cached is not None:
             return cached
-        value = loader()
-        self.set(namespace, key, value, ttl_seconds)
-        return value
+        if _on_event_loop():
+            # 事件循环线程上等待其他线程的 loader 会卡住整个 loop：直接加载
+            value = loader()
+            self.set(namespace, key, value, ttl_seconds)
+            return value
+        flight_key = (namespace, key)
+        with self._inflight_lock:
+            flight = self._inflight.get(flight_key)
+            leader = flight is None
+            if leader:
+                future: Future[Any] = Future()
+                self._inflight[flight_key] = (future, get_ident())
+            else:
+                future, leader_thread = flight
+        if not leader:
+            if leader_thread == get_ident():
+                # loader 内部重入同一 key：等待自己会死锁
+                return loader()
+            try:
+                return future.result(timeout=_REMEMBER_WAIT_SECONDS)
+            except TimeoutError:
+                # leader 迟迟未返回：不再等待，自行加载（不写缓存，交由 leader 写入）
+                return loader()
+        try:
+            value = loader()
+            self.set(namespace, key, value, ttl_seconds)
+            future.set_result(value)
+            return value
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(flight_key, None)
 
     async def remember_async(
         self,
         namespace: str,
         key: str,
         ttl_seconds: int,
-        loader: Callable[[], Any | Awaitable[Any]],
+        loader: Callable[[], Awaitable[Any]],
     ) -> Any:
-        cached = self.get(namespace, key)
+        cached = await self.aget(namespace, key)
         if cached is not None:
             return cached
-        value = loader()
-        if inspect.isawaitable(value):
-            value = await value
-        self.set(namespace, key, value, ttl_seconds)
-        return value
+        flight_key = (namespace, key)
+        loop = asyncio.get_running_loop()
+        with self._inflight_lock:
+            future = self._inflight_async.get(flight_key)
+            leader = future is None
+            if leader:
+                future = self._inflight_async[flight_key] = loop.create_future()
+        if not leader and future.get_loop() is loop:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # leader 被取消：由当前调用方自行加载
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            if leader:
+                future.cancel()
+            raise
+        except BaseException as exc:
+            if leader:
+                future.set_exception(exc)
+                future.exception()  # 无等待者时不记录 "never retrieved"
+            raise
+        else:
+            self.set(namespace, key, value, ttl_seconds)
+            if leader:
+                future.set_result(value)
+            return value
+        finally:
+            if leader:
+                with self._inflight_lock:
+                    self._inflight_async.pop(flight_key, None)
+
+
+# 只有 str/int/None 走记忆化：bool/float 与 int 相等且哈希相同，会命中错误的 key 文本
+_KEY_MEMO_TYPES = frozenset((str, int, type(None)))
+
+
+@lru_cache(maxsize=8192)
+def _join_cache_key(parts: tuple[Any, ...], items: tuple[tuple[str, Any], ...]) -> str:
+    positional = "|".join(map(str, parts))
+    if not items:
+        return positional
+    keyword = "|".join(f"{key}={value}" for key, value in items)
+    return f"{positional}::{keyword}" if positional else keyword
 
 
 def build_cache_key(*parts: Any, **named_parts: Any) -> str:
     """Creates a deterministic cache key from args for convenience."""
 
-    positional = "|".join(str(part) for part in parts)
-    keyword = "|".join(f"{key}={value}" for key, value in sorted(named_parts.items()))
-    if positional and keyword:
-        return f"{positional}::{keyword}"
-    if positional:
-        return positional
-    return keyword
+    items = tuple(sorted(named_parts.items())) if named_parts else ()
+    if _KEY_MEMO_TYPES.issuperset(map(type, parts)) and _KEY_MEMO_TYPES.issuperset(
+        [type(value) for _, value in items]
+    ):
+        return _join_cache_key(parts, items)
+    return _join_cache_key.__wrapped__(parts, items)
+
+
+_WRITE_BATCH_MAX = 256  # SETEX commands per pipeline flush
+
+# 原始类型走 1 字节类型前缀，跳过 pickle；pickle 负载本身以 0x80 开头，保持无前缀，
+# 旧版本写入的条目仍可直接读取。
+_TAG_PICKLE = 0x80
+_TAG_BYTES = b"r"
+_TAG_STR = b"s"
+_TAG_INT = b"i"
+
+
+def _encode_value(value: Any) -> bytes:
+    kind = type(value)
+    if kind is str:
+        return _TAG_STR + value.encode("utf-8")
+    if kind is bytes:
+        return _TAG_BYTES + value
+    if kind is int and -(1 << 63) <= value < (1 << 63):
+        return _TAG_INT + value.to_bytes(8, "little", signed=True)
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_value(raw: bytes) -> Any | None:
+    if not raw:
+        return None
+    tag = raw[0]
+    if tag == _TAG_PICKLE:
+        try:
+            return pickle.loads(raw)
+        except Exception:
+            return None
+    if tag == _TAG_STR[0]:
+        return raw[1:].decode("utf-8", errors="replace")
+    if tag == _TAG_BYTES[0]:
+        return raw[1:]
+    if tag == _TAG_INT[0] and len(raw) == 9:
+        return int.from_bytes(raw[1:], "little", signed=True)
+    return None
+
+
+_INDEX_PRUNE_SLACK_SECONDS = 5.0  # clock-skew margin before index members expire
+_WRITE_QUEUE_MAX = 10_000  # pending writes before new ones are dropped
+_WRITE_MAX_AGE_SECONDS = 2.0  # older queued writes are discarded, not written
+_WRITE_LOG_INTERVAL = 10.0  # min seconds between drop/failure warnings
+
+# (full_key, ttl_seconds, payload, namespace index key, enqueued_at)
+_PendingWrite = tuple[bytes, int, bytes, bytes, float]
 
 
 class RedisCacheBackend(CacheBackend):
-    """Redis-backed cache providing cross-process sharing."""
+    """Redis-backed cache providing cross-process sharing.
+
+    Writes are fire-and-forget: ``set``/``set_many`` enqueue the encoded
+    payload and a daemon thread flushes pending entries through a pipeline,
+    so request handlers never wait on a SETEX round-trip. ``invalidate``
+    flushes first so a queued write cannot resurrect an invalidated key.
+
+    The queue is bounded: when Redis is slow or unreachable new writes are
+    dropped (counted in ``stats()``) instead of growing memory. Across
+    processes a write queued before another worker's ``invalidate`` can
+    still land after it; writes older than ``_WRITE_MAX_AGE_SECONDS`` are
+    discarded so that window stays bounded.
 
-    def __init__(self, url: str, namespace_prefix: str = "cache") -> None:
+    Every written key is also recorded in a per-namespace sorted set scored
+    by its expiry time, so a namespace-wide ``invalidate`` deletes exactly
+    those keys instead of SCANning the whole keyspace. Each write batch trims
+    expired members, keeping the index no larger than the live keys.
+    """
+
+    def __init__(
+        self, url: str, namespace_prefix: str = "cache", itersize: int = 1000
+    ) -> None:
         if Redis is None:
             raise RuntimeError("redis package not available")
-        self._client = Redis.from_url(url, decode_responses=False)
+        self._url = url
+        self._client = Redis(connection_pool=get_redis_pool(url))
+        self._async_redis: AsyncRedis | None = None
+        self._init_inflight()
         self._prefix = namespace_prefix.rstrip(":")
+        self._ns_prefixes: dict[str, bytes] = {}
+        self._index_keys: dict[str, bytes] = {}
+        self._itersize = max(itersize, 1)
+        self._write_queue: queue.Queue[_PendingWrite] = queue.Queue(
+            maxsize=_WRITE_QUEUE_MAX
+        )
+        self._dropped_writes = 0  # 近似计数：多线程自增不加锁
+        self._last_warning_at = 0.0
+        self._write_lock = Lock()
+        self._writer = Thread(
+            target=self._write_loop, name="redis-cache-writer", daemon=True
+        )
+        self._writer.start()
 
-    def _full_key(self, namespace: str, key: str) -> str:
-        return f"{self._prefix}:{namespace}:{key}"
+    def _full_key(self, namespace: str, key: str) -> bytes:
+        # 命名空间前缀编码一次后复用；返回 bytes，redis-py 打包命令时无需再编码
+        prefix = self._ns_prefixes.get(namespace)
+        if prefix is None:
+            prefix = self._ns_prefixes[namespace] = (
+                f"{self._prefix}:{namespace}:".encode()
+            )
+        return prefix + key.encode()
+
+    def _index_key(self, namespace: str) -> bytes:
+        # 与数据 key 用不同分隔符，避免与名为 "index" 的命名空间冲突
+        index_key = self._index_keys.get(namespace)
+        if index_key is None:
+            index_key = self._index_keys[namespace] = (
+                f"{self._prefix}#keys:{namespace}".encode()
+            )
+        return index_key
 
     def get(self, namespace: str, key: str) -> Any | None:
         full_key = self._full_key(namespace, key)
@@ -129,33 +418,163 @@ class RedisCacheBackend(CacheBackend):
             return None
         if raw is None:
             return None
+        return _decode_value(raw)
+
+    def _async_client(self) -> AsyncRedis:
+        # 连接池由 app.core.redis 按 loop 管理、shutdown 时关闭；池变化时重建客户端
+        pool = get_async_redis_pool(self._url)
+        client = self._async_redis
+        if client is None or client.connection_pool is not pool:
+            client = self._async_redis = AsyncRedis(connection_pool=pool)
+        return client
+
+    async def aget(self, namespace: str, key: str) -> Any | None:
         try:
-            return pickle.loads(raw)
-        except Exception:
+            raw = await self._async_client().get(self._full_key(namespace, key))
+        except RedisError:
+            return None
+        if raw is None:
             return None
+        return _decode_value(raw)
 
     def set(self, namespace: str, key: str, value: Any, ttl_seconds: int) -> None:
-        full_key = self._full_key(namespace, key)
-        payload = pickle.dumps(value)
+        self._enqueue_write(
+            (
+                self._full_key(namespace, key),
+                max(ttl_seconds, 1),
+                _encode_value(value),
+                self._index_key(namespace),
+                monotonic(),
+            )
+        )
+
+    def _enqueue_write(self, write: _PendingWrite) -> None:
+        try:
+            self._write_queue.put_nowait(write)
+        except queue.Full:
+            self._dropped_writes += 1
+            self._warn("cache.redis_write_dropped", reason="queue_full")
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
         try:
-            self._client.setex(full_key, max(ttl_seconds, 1), payload)
+            raws = self._client.mget([self._full_key(namespace, k) for k in keys])
         except RedisError:
-            return None
+            return {}
+        found: dict[str, Any] = {}
+        for key, raw in zip(keys, raws, strict=False):
+            if raw is None:
+                continue
+            value = _decode_value(raw)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(
+        self, namespace: str, items: Mapping[str, Any], ttl_seconds: int
+    ) -> None:
+        ttl = max(ttl_seconds, 1)
+        index_key = self._index_key(namespace)
+        enqueued_at = monotonic()
+        for key, value in items.items():
+            self._enqueue_write(
+                (
+                    self._full_key(namespace, key),
+                    ttl,
+                    _encode_value(value),
+                    index_key,
+                    enqueued_at,
+                )
+            )
+
+    def _write_loop(self) -> None:
+        while True:
+            first = self._write_queue.get()
+            try:
+                with self._write_lock:
+                    self._write_batch(self._drain_writes(first, _WRITE_BATCH_MAX))
+            except Exception as exc:
+                # 写线程没有人重启：单批异常只记录，不能让它退出后永久丢写
+                self._warn("cache.redis_write_failed", error=repr(exc))
+
+    def _drain_writes(
+        self, first: _PendingWrite | None, limit: int | None
+    ) -> list[_PendingWrite]:
+        batch = [first] if first is not None else []
+        while limit is None or len(batch) < limit:
+            try:
+                batch.append(self._write_queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: list[_PendingWrite]) -> None:
+        # 积压过久的写入可能晚于其他进程的 invalidate，直接丢弃而不是写回旧值
+        cutoff = monotonic() - _WRITE_MAX_AGE_SECONDS
+        fresh = [write for write in batch if write[4] >= cutoff]
+        if len(fresh) < len(batch):
+            self._dropped_writes += len(batch) - len(fresh)
+            self._warn("cache.redis_write_dropped", reason="stale")
+        batch = fresh
+        if not batch:
+            return
+        # 索引为 ZSET，score 为 key 的过期时刻（墙钟）：每批顺带删掉已过期成员，
+        # 索引大小始终不超过命名空间内存活 key 数；不依赖 Redis 7 的 EXPIRE NX/GT
+        now = time()
+        indexes: dict[bytes, dict[bytes, float]] = {}
+        for full_key, ttl, _, index_key, _ in batch:
+            indexes.setdefault(index_key, {})[full_key] = now + ttl
+        try:
+            with self._client.pipeline(transaction=False) as pipe:
+                for full_key, ttl, payload, _, _ in batch:
+                    pipe.setex(full_key, ttl, payload)
+                for index_key, members in indexes.items():
+                    pipe.zadd(index_key, members)
+                    pipe.zremrangebyscore(
+                        index_key, "-inf", now - _INDEX_PRUNE_SLACK_SECONDS
+                    )
+                pipe.execute()
+        except RedisError as exc:
+            self._warn("cache.redis_write_failed", error=str(exc), batch=len(batch))
+
+    def _warn(self, event: str, **extra: Any) -> None:
+        # Redis 不可用时每次写入都会失败：限频，避免刷屏
+        now = monotonic()
+        if now - self._last_warning_at < _WRITE_LOG_INTERVAL:
+            return
+        self._last_warning_at = now
+        LOGGER.warning(event, extra={"dropped_writes": self._dropped_writes, **extra})
+
+    def flush(self) -> None:
+        with self._write_lock:
+            self._write_batch(self._drain_writes(None, None))
 
     def invalidate(self, namespace: str, key: str | None = None) -> None:
+        self.flush()
         if key is not None:
             try:
                 self._client.delete(self._full_key(namespace, key))
             except RedisError:
                 return
             return
-        pattern = f"{self._prefix}:{namespace}:*"
+        index_key = self._index_key(namespace)
+        # 按索引删除：O(成员数)，不再 SCAN keyspace；每 itersize 个 key 一条 DEL
         try:
-            for found in self._client.scan_iter(pattern):
-                self._client.delete(found)
+            members = self._client.zrange(index_key, 0, -1)
+            with self._client.pipeline(transaction=False) as pipe:
+                for start in range(0, len(members), self._itersize):
+                    pipe.delete(*members[start : start + self._itersize])
+                pipe.delete(index_key)
+                pipe.execute()
         except RedisError:
             return
 
+    def stats(self) -> dict[str, int]:
+        # 命中统计由 Redis 服务端维护（INFO stats），进程内只记录丢弃的写入
+        return {"dropped_writes": self._dropped_writes}
+
 
 def _init_cache_backend() -> CacheBackend:
     provider = getattr(settings, "cache_provider", "memory")
@@ -169,7 +588,7 @@ def _init_cache_backend() -> CacheBackend:
                 f"Redis cache init failed ({exc}), falling back to in-memory cache",
                 stacklevel=2,
             )
-    return CacheBackend()
+    return CacheBackend(max_entries_per_ns=settings.cache_max_entries_per_ns)
 
 
 cache_backend = _init_cache_backend()
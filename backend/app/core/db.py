@@ -4,8 +4,10 @@ from contextlib import contextmanager
 from time import monotonic, perf_counter
 from typing import Any, Generator
 
+import orjson
 from anyio import to_thread
 from app.core.settings import settings
+from app.utils.json_utils import orjson_dumps
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
@@ -14,7 +16,7 @@ from sqlalchemy.orm import Session, sessionmaker
 _engine: Engine | None = None
 _session_factory: sessionmaker[Session] | None = None
 _cached_db_status: dict[str, Any] | None = None
-_cached_db_ts: float | None = None
+_cached_db_expires_at: float = 0.0  # monotonic deadline, 0 = no cache
 HEALTH_CACHE_SECONDS = 5.0
 
 
@@ -22,13 +24,24 @@ def get_engine() -> Engine:
     global _engine
     if _engine is None:
         connect_args: dict[str, Any] = {}
+        pool_args: dict[str, Any] = {}
         if settings.database_url.startswith("postgresql"):
             connect_args["connect_timeout"] = 1
+            # 同步路由与 to_thread 共享 anyio 线程池（默认 40），连接池需能覆盖并发
+            pool_args = {
+                "pool_size": settings.db_pool_size,
+                "max_overflow": settings.db_max_overflow,
+                "pool_recycle": settings.db_pool_recycle_seconds,
+            }
         _engine = create_engine(
             settings.database_url,
             connect_args=connect_args,
             pool_pre_ping=True,
             future=True,
+            # JSON/JSONB 列（meta/ext/payload/result）走 orjson 编解码
+            json_serializer=orjson_dumps,
+            json_deserializer=orjson.loads,
+            **pool_args,
         )
     return _engine
 
@@ -88,17 +101,16 @@ def dispose_engine() -> None:
 
 
 def invalidate_db_health_cache() -> None:
-    global _cached_db_status, _cached_db_ts
+    global _cached_db_status, _cached_db_expires_at
     _cached_db_status = None
-    _cached_db_ts = None
+    _cached_db_expires_at = 0.0
 
 
 async def check_db_health(use_cache: bool = True) -> dict[str, Any]:
-    global _cached_db_status, _cached_db_ts
+    global _cached_db_status, _cached_db_expires_at
 
-    if use_cache and _cached_db_status is not None and _cached_db_ts is not None:
-        if monotonic() - _cached_db_ts < HEALTH_CACHE_SECONDS:
-            return _cached_db_status
+    if use_cache and monotonic() < _cached_db_expires_at:
+        return _cached_db_status
 
     def _run() -> dict[str, Any]:
         engine = get_engine()
@@ -116,5 +128,5 @@ async def check_db_health(use_cache: bool = True) -> dict[str, Any]:
     result = await to_thread.run_sync(_run)
     if use_cache:
         _cached_db_status = result
-        _cached_db_ts = monotonic()
+        _cached_db_expires_at = monotonic() + HEALTH_CACHE_SECONDS
     return result
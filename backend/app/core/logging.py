@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
+import queue
 from pathlib import Path
 from typing import Any, Dict
 
@@ -51,13 +54,50 @@ def _build_logging_config(log_dir: Path) -> Dict[str, Any]:
     }
 
 
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def setup_logging() -> None:
-    """Configure logging once at application start."""
+    """Configure logging once at application start.
 
+    The configured handlers are moved behind a QueueHandler: request threads
+    only enqueue records, and a QueueListener thread does the console/file
+    writes and log rotation.
+    """
+
+    _stop_queue_listener()
     log_dir = Path(settings.log_directory).resolve()
     log_dir.mkdir(parents=True, exist_ok=True)
     config = _build_logging_config(log_dir)
     logging.config.dictConfig(config)
+    # 格式串只用 asctime/levelname/name/message：跳过线程、进程、task 与调用栈帧采集
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+    logging._srcfile = None
+
+    global _queue_listener
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    for handler in handlers:
+        root.removeHandler(handler)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+atexit.register(_stop_queue_listener)
 
 
 def get_logger(name: str | None = None) -> logging.Logger:
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import weakref
 from time import monotonic, perf_counter
 
 from app.core.settings import settings
+from redis import ConnectionPool
+from redis.asyncio import ConnectionPool as AsyncConnectionPool
 from redis.asyncio import Redis
 
 _redis_client: Redis | None = None
+_redis_pools: dict[tuple[str, bool], ConnectionPool] = {}
+# asyncio 连接绑定创建它的事件循环：按 loop 分组，loop 回收后条目随之释放
+_async_redis_pools: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, AsyncConnectionPool]
+] = weakref.WeakKeyDictionary()
 _cached_redis_status: dict[str, object] | None = None
-_cached_redis_ts: float | None = None
+_cached_redis_expires_at: float = 0.0  # monotonic deadline, 0 = no cache
 HEALTH_CACHE_SECONDS = 5.0
 
 
@@ -24,6 +33,43 @@ def get_redis_client() -> Redis:
     return _redis_client
 
 
+def get_redis_pool(url: str, *, decode_responses: bool = False) -> ConnectionPool:
+    """Process-wide sync connection pool per (url, decode_responses).
+
+    decode_responses is a connection-level option in redis-py, so binary
+    (cache) and text (metrics) clients cannot share one pool; everything else
+    with the same settings reuses sockets instead of opening its own pool.
+    """
+
+    key = (url, decode_responses)
+    pool = _redis_pools.get(key)
+    if pool is None:
+        pool = _redis_pools.setdefault(
+            key, ConnectionPool.from_url(url, decode_responses=decode_responses)
+        )
+    return pool
+
+
+def get_async_redis_pool(url: str) -> AsyncConnectionPool:
+    """Binary (decode_responses=False) asyncio pool for the running loop.
+
+    Shared by every async cache reader on the loop; closed by
+    close_async_redis_pools() on application shutdown.
+    """
+
+    pools = _async_redis_pools.setdefault(asyncio.get_running_loop(), {})
+    pool = pools.get(url)
+    if pool is None:
+        pool = pools[url] = AsyncConnectionPool.from_url(url, decode_responses=False)
+    return pool
+
+
+async def close_async_redis_pools() -> None:
+    pools = _async_redis_pools.pop(asyncio.get_running_loop(), {})
+    for pool in pools.values():
+        await pool.aclose()
+
+
 async def close_redis_client() -> None:
     global _redis_client
     if _redis_client is not None:
@@ -33,17 +79,16 @@ async def close_redis_client() -> None:
 
 
 def invalidate_redis_health_cache() -> None:
-    global _cached_redis_status, _cached_redis_ts
+    global _cached_redis_status, _cached_redis_expires_at
     _cached_redis_status = None
-    _cached_redis_ts = None
+    _cached_redis_expires_at = 0.0
 
 
 async def check_redis_health(use_cache: bool = True) -> dict[str, object]:
-    global _cached_redis_status, _cached_redis_ts
+    global _cached_redis_status, _cached_redis_expires_at
 
-    if use_cache and _cached_redis_status is not None and _cached_redis_ts is not None:
-        if monotonic() - _cached_redis_ts < HEALTH_CACHE_SECONDS:
-            return _cached_redis_status
+    if use_cache and monotonic() < _cached_redis_expires_at:
+        return _cached_redis_status
 
     client = get_redis_client()
     start = perf_counter()
@@ -60,5 +105,5 @@ async def check_redis_health(use_cache: bool = True) -> dict[str, object]:
 
     if use_cache:
         _cached_redis_status = result
-        _cached_redis_ts = monotonic()
+        _cached_redis_expires_at = monotonic() + HEALTH_CACHE_SECONDS
     return result
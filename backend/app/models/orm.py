@@ -52,8 +52,12 @@ class TransportMode(StrEnum):
     TRANSIT = "transit"
 
 
+_TRANSPORT_VALUES: list[str] = [member.value for member in TransportMode]
+
+
 def _transport_values(enum_cls: type[TransportMode]) -> list[str]:
-    return [member.value for member in enum_cls]
+    # Enum.adapt() 在每个方言/引擎上会重新调用 values_callable，直接复用预先算好的列表
+    return _TRANSPORT_VALUES
 
 
 TRANSPORT_ENUM = sa.Enum(
@@ -167,6 +171,10 @@ class Poi(TimestampMixin, Base):
             "provider_id",
             name="uq_pois_provider_identifier",
         ),
+        # 与 stage2 迁移保持一致：仅 Postgres 建 GIST，供 ST_DWithin / KNN 使用
+        sa.Index("ix_pois_geom", "geom", postgresql_using="gist").ddl_if(
+            dialect="postgresql"
+        ),
     )
 
     id: Mapped[int] = mapped_column(
@@ -193,6 +201,9 @@ class SubTrip(TimestampMixin, Base):
         sa.UniqueConstraint(
             "day_card_id", "order_index", name="uq_sub_trips_day_order"
         ),
+        sa.Index("ix_sub_trips_geom", "geom", postgresql_using="gist").ddl_if(
+            dialect="postgresql"
+        ),
     )
 
     id: Mapped[int] = mapped_column(
@@ -356,7 +367,13 @@ class AiTask(Base):
     __tablename__ = "ai_tasks"
     __table_args__ = (
         sa.Index("ix_ai_tasks_created_at", "created_at"),
-        sa.Index("ix_ai_tasks_user_id", "user_id"),
+        # 覆盖按用户统计进行中任务的限流查询（user_id + status IN ...）
+        sa.Index(
+            "ix_ai_tasks_user_status_created",
+            "user_id",
+            "status",
+            sa.text("created_at DESC"),
+        ),
         sa.Index("ix_ai_tasks_status", "status"),
         sa.Index("ix_ai_tasks_finished_at", "finished_at"),
     )
@@ -14,17 +14,6 @@ SeedMode = Literal["fast"]
 DEFAULT_INTERESTS: list[str] = ["sight", "food"]
 
 
-def _normalize_interests(value: Any) -> list[str]:
-    if not isinstance(value, list):
-        return DEFAULT_INTERESTS.copy()
-    normalized: list[str] = []
-    for raw in value:
-        text = str(raw).strip()
-        if text:
-            normalized.append(text)
-    return normalized or DEFAULT_INTERESTS.copy()
-
-
 class PlanRequest(BaseModel):
     user_id: int = Field(..., ge=1)
     destination: str = Field(..., min_length=1, max_length=255)
@@ -68,9 +57,14 @@ class PlanRequest(BaseModel):
             msg = "end_date must be >= start_date"
             raise ValueError(msg)
 
-        prefs = self.preferences if isinstance(self.preferences, dict) else {}
-        prefs = dict(prefs)
-        prefs["interests"] = _normalize_interests(prefs.get("interests"))
+        prefs = dict(self.preferences) if isinstance(self.preferences, dict) else {}
+        interests = prefs.get("interests")
+        normalized = (
+            [text for raw in interests if (text := str(raw).strip())]
+            if isinstance(interests, list)
+            else None
+        )
+        prefs["interests"] = normalized or DEFAULT_INTERESTS.copy()
         self.preferences = prefs
         return self
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from app.models.orm import DayCard
+from app.models.orm import DayCard, SubTrip
 from sqlalchemy.orm import Session, selectinload
 
 from .base import BaseRepository
@@ -17,7 +17,7 @@ class DayCardRepository(BaseRepository):
     def get(self, day_card_id: int) -> DayCard | None:
         return (
             self.session.query(DayCard)
-            .options(selectinload(DayCard.sub_trips))
+            .options(selectinload(DayCard.sub_trips).selectinload(SubTrip.poi))
             .filter(DayCard.id == day_card_id)
             .one_or_none()
         )
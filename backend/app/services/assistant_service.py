@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 from app.agents import AssistantState, build_assistant_graph, build_tool_registry
@@ -60,6 +61,26 @@ class AssistantService:
         *,
         stream_handler: StreamCallback | None = None,
     ) -> ChatResult:
+        result: ChatResult | None = None
+        async for item in self.run_chat_stream(
+            payload, emit_chunks=bool(stream_handler)
+        ):
+            if isinstance(item, ChatResult):
+                result = item
+            elif stream_handler:
+                await stream_handler(item)
+        if result is None:
+            raise RuntimeError("assistant chat stream ended without a final result")
+        return result
+
+    async def run_chat_stream(
+        self,
+        payload: ChatPayload,
+        *,
+        emit_chunks: bool = True,
+    ) -> AsyncIterator[AiStreamChunk | ChatResult]:
+        """Yield answer chunks as soon as they exist, then the final ChatResult."""
+
         session_obj = self._ensure_session(payload)
         history = self._load_history(session_obj.id)
         max_k = payload.top_k_memory or settings.mem0_default_k
@@ -116,8 +137,9 @@ class AssistantService:
                 "latency_ms": (result_state.ai_meta or {}).get("latency_ms"),
             },
         )
-        if stream_handler:
-            await self._emit_stream(answer, result_state.ai_meta, stream_handler)
+        if emit_chunks:
+            for chunk in self._iter_stream_chunks(answer, result_state.ai_meta):
+                yield chunk
 
         memory_record_id = await self._write_memory(
             payload=payload,
@@ -156,7 +178,7 @@ class AssistantService:
             tool_result=tool_result,
             tool_error=result_state.tool_error,
         )
-        return result
+        yield result
 
     def _ensure_session(
         self,
@@ -291,24 +313,23 @@ class AssistantService:
             return MemoryLevel.trip
         return MemoryLevel.user
 
-    async def _emit_stream(
-        self,
+    @staticmethod
+    def _iter_stream_chunks(
         answer: str,
         ai_meta: dict[str, Any] | None,
-        stream_handler: StreamCallback,
-    ) -> None:
+    ) -> Iterator[AiStreamChunk]:
         trace_id = (ai_meta or {}).get("trace_id") or "assistant-stream"
         parts = [answer[i : i + 40] for i in range(0, len(answer), 40)] or [""]
+        last = len(parts) - 1
         for idx, chunk in enumerate(parts):
-            await stream_handler(
-                AiStreamChunk(
-                    trace_id=trace_id,
-                    delta=chunk,
-                    index=idx,
-                    done=idx == len(parts) - 1,
-                )
+            yield AiStreamChunk(
+                trace_id=trace_id,
+                delta=chunk,
+                index=idx,
+                done=idx == last,
             )
 
+
 _assistant_service: AssistantService | None = None
 
 
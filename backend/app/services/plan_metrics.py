@@ -12,6 +12,7 @@ from app.core.logging import get_logger
 from app.core.settings import settings
 
 try:
+    from app.core.redis import get_redis_pool
     from redis import Redis
     from redis.exceptions import RedisError
 except Exception:  # pragma: no cover - optional dependency
@@ -191,7 +192,7 @@ class RedisPlanMetricsBackend:
     ) -> None:
         if Redis is None:
             raise RuntimeError("redis package not available")
-        self._client = Redis.from_url(url, decode_responses=True)
+        self._client = Redis(connection_pool=get_redis_pool(url, decode_responses=True))
         self._ns = namespace.rstrip(":")
         self._history_limit = max(int(history_limit), 1)
         self._latency_limit = max(int(latency_limit), 1)
@@ -10,13 +10,22 @@ from app.agents.planner.state import PlannerState
 from app.core.db import session_scope
 from app.core.logging import get_logger
 from app.models.orm import User
-from app.models.plan_schemas import PlanRequest, PlanResponseData, PlanTripSchema
-from app.models.schemas import DayCardCreate, SubTripCreate, TripCreate, TripSchema
+from app.models.plan_schemas import (
+    PlanDayCardSchema,
+    PlanRequest,
+    PlanResponseData,
+    PlanTripSchema,
+)
+from app.models.schemas import DayCardCreate, TripCreate, TripSchema
 from app.services.deep_planner import DeepPlanner
 from app.services.fast_planner import FastPlanner
 from app.services.plan_metrics import get_plan_metrics
 from app.services.poi_service import PoiService, get_poi_service
 from app.services.trip_service import TripService
+from pydantic import TypeAdapter
+
+# 按属性直接校验 Plan* 模型，省去逐条 model_dump() 再 SubTripCreate(**...) 的往返
+_DAY_CARD_CREATE_LIST_ADAPTER = TypeAdapter(list[DayCardCreate])
 
 
 class PlanServiceError(Exception):
@@ -211,19 +220,9 @@ class PlanService:
                     code=14072,
                 )
 
-        day_cards: list[DayCardCreate] = []
-        for card in plan.day_cards:
-            sub_trips: list[SubTripCreate] = []
-            for sub in card.sub_trips:
-                sub_trips.append(SubTripCreate(**sub.model_dump()))
-            day_cards.append(
-                DayCardCreate(
-                    day_index=card.day_index,
-                    date=card.date,
-                    note=card.note,
-                    sub_trips=sub_trips,
-                )
-            )
+        day_cards = _DAY_CARD_CREATE_LIST_ADAPTER.validate_python(
+            plan.day_cards, from_attributes=True
+        )
         payload = TripCreate(
             user_id=user_id,
             title=plan.title,
@@ -238,39 +237,39 @@ class PlanService:
 
 
 def _merge_persisted_ids(plan: PlanTripSchema, persisted: TripSchema) -> PlanTripSchema:
+    # plan 已是校验过的内部数据：model_copy 只回填持久化 id，不再整棵树 dump→validate
     day_map = {card.day_index: card for card in persisted.day_cards}
-    enriched_cards = []
+    enriched_cards: list[PlanDayCardSchema] = []
     for card in plan.day_cards:
         persisted_card = day_map.get(card.day_index)
+        if persisted_card is None:
+            enriched_cards.append(card.model_copy(update={"id": None, "trip_id": None}))
+            continue
+        sub_map = {sub.order_index: sub for sub in persisted_card.sub_trips}
         sub_trips = []
-        if persisted_card:
-            sub_map = {sub.order_index: sub for sub in persisted_card.sub_trips}
-            for sub in card.sub_trips:
-                persisted_sub = (
-                    sub_map.get(sub.order_index)
-                    if sub.order_index is not None
-                    else None
+        for sub in card.sub_trips:
+            persisted_sub = (
+                sub_map.get(sub.order_index) if sub.order_index is not None else None
+            )
+            sub_trips.append(
+                sub.model_copy(
+                    update={
+                        "id": persisted_sub.id if persisted_sub else None,
+                        "day_card_id": persisted_card.id,
+                    }
                 )
-                payload = sub.model_dump(mode="json")
-                payload["id"] = persisted_sub.id if persisted_sub else None
-                payload["day_card_id"] = persisted_card.id if persisted_card else None
-                sub_trips.append(payload)
-        else:
-            sub_trips = [sub.model_dump(mode="json") for sub in card.sub_trips]
-
+            )
         enriched_cards.append(
-            {
-                **card.model_dump(mode="json"),
-                "id": persisted_card.id if persisted_card else None,
-                "trip_id": persisted.id if persisted_card else None,
-                "sub_trips": sub_trips,
-            }
+            card.model_copy(
+                update={
+                    "id": persisted_card.id,
+                    "trip_id": persisted.id,
+                    "sub_trips": sub_trips,
+                }
+            )
         )
 
-    payload = plan.model_dump(mode="json")
-    payload["id"] = persisted.id
-    payload["day_cards"] = enriched_cards
-    return PlanTripSchema(**payload)
+    return plan.model_copy(update={"id": persisted.id, "day_cards": enriched_cards})
 
 
 _plan_service: PlanService | None = None
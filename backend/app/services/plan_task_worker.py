@@ -11,6 +11,7 @@ from app.core.settings import settings
 from app.models.orm import AiTask
 from app.models.plan_schemas import PlanRequest
 from app.services.plan_service import PlanServiceError, get_plan_service
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
 
 
@@ -95,39 +96,41 @@ class PlanTaskWorker:
             return
 
         with session_scope() as session:
-            query = session.query(AiTask).filter(
+            # 只取 (id, status)：不拉取 request_json/result_json 大字段
+            query = session.query(AiTask.id, AiTask.status).filter(
                 AiTask.status.in_(["queued", "pending", "running"])
             )
             try:
                 query = query.filter(AiTask.payload["kind"].astext == self.KIND)
             except Exception:
                 pass
-            rows: list[AiTask] = query.order_by(AiTask.created_at.asc()).all()
+            rows = query.order_by(AiTask.created_at.asc()).all()
 
             queued_ids: list[str] = []
             running_ids: list[str] = []
-            for row in rows:
-                status = str(row.status or "")
+            for task_id, task_status in rows:
+                status = str(task_status or "")
                 if status in {"queued", "pending"}:
-                    queued_ids.append(str(row.id))
+                    queued_ids.append(str(task_id))
                 elif status == "running":
-                    running_ids.append(str(row.id))
+                    running_ids.append(str(task_id))
 
             if running_ids:
-                now = datetime.now(timezone.utc)
-                for task_id in running_ids:
-                    row = session.get(AiTask, task_id)
-                    if row is None:
-                        continue
-                    row.status = "failed"
-                    row.error = json.dumps(
-                        {
-                            "type": "worker_restart",
-                            "message": "worker restarted before task finished",
-                        },
-                        ensure_ascii=False,
+                session.execute(
+                    update(AiTask)
+                    .where(AiTask.id.in_(running_ids))
+                    .values(
+                        status="failed",
+                        error=json.dumps(
+                            {
+                                "type": "worker_restart",
+                                "message": "worker restarted before task finished",
+                            },
+                            ensure_ascii=False,
+                        ),
+                        finished_at=datetime.now(timezone.utc),
                     )
-                    row.finished_at = now
+                )
                 session.commit()
 
         for task_id in queued_ids:
@@ -286,8 +286,7 @@ class PoiService:
             dialect = session.bind.dialect.name if session.bind else "postgresql"
             if dialect != "postgresql":
                 return []
-            stmt = text(
-                """
+            stmt = text("""
                     SELECT id, provider, provider_id, name, category, addr, rating,
                            ST_Y(geom::geometry) AS lat,
                            ST_X(geom::geometry) AS lng,
@@ -306,10 +305,11 @@ class PoiService:
                           :radius
                       )
                       AND (:poi_type IS NULL OR category = :poi_type)
-                    ORDER BY distance_m ASC
+                    ORDER BY geom <-> ST_SetSRID(
+                        ST_MakePoint(:lng, :lat), 4326
+                    )::geography
                     LIMIT :limit
-                    """
-            ).bindparams(
+                    """).bindparams(
                 sa.bindparam("lat", type_=sa.Float),
                 sa.bindparam("lng", type_=sa.Float),
                 sa.bindparam("radius", type_=sa.Integer),
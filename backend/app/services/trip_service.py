@@ -21,6 +21,7 @@ from app.models.schemas import (
     TripUpdate,
 )
 from app.repositories import DayCardRepository, SubTripRepository, TripRepository
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.orm import attributes as orm_attributes
@@ -30,6 +31,8 @@ TRIP_DETAIL_CACHE_NS = "trip:detail"
 TRIP_LIST_TTL_SECONDS = 30
 TRIP_DETAIL_TTL_SECONDS = 45
 
+_TRIP_SUMMARY_LIST_ADAPTER = TypeAdapter(list[TripSummarySchema])
+
 
 class TripServiceError(Exception):
     """Base class for business friendly errors surfaced to API consumers."""
@@ -289,6 +292,36 @@ class TripQueryService(TripServiceBase):
             _loader,
         )
 
+    def list_trips_json(
+        self,
+        *,
+        user_id: int | None,
+        destination: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> bytes:
+        """Serialized form of ``list_trips``; shares its namespace for invalidation."""
+
+        cache_key = build_cache_key(
+            "json", user_id or "all", destination or "*", limit, offset
+        )
+
+        def _loader() -> bytes:
+            summaries = self.list_trips(
+                user_id=user_id,
+                destination=destination,
+                limit=limit,
+                offset=offset,
+            )
+            return _TRIP_SUMMARY_LIST_ADAPTER.dump_json(summaries)
+
+        return cache_backend.remember(
+            TRIP_LIST_CACHE_NS,
+            cache_key,
+            TRIP_LIST_TTL_SECONDS,
+            _loader,
+        )
+
     def get_trip(self, trip_id: int) -> TripSchema:
         cache_key = str(trip_id)
 
@@ -398,7 +431,9 @@ class DayCardService(TripServiceBase):
             session.add(day_card)
             session.flush()
             self._persist_sub_trips(session, day_card, payload.sub_trips)
-            session.refresh(day_card)
+            # 重新加载并预取 sub_trips→poi，替代 refresh 后逐条懒加载
+            day_card = DayCardRepository(session).get(day_card.id)
+            assert day_card is not None
             self._hydrate_day_card(day_card)
             schema = DayCardSchema.model_validate(day_card)
             trip_id = day_card.trip_id
@@ -714,6 +749,21 @@ class TripService:
             offset=offset,
         )
 
+    def list_trips_json(
+        self,
+        *,
+        user_id: int | None,
+        destination: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> bytes:
+        return self.query_service.list_trips_json(
+            user_id=user_id,
+            destination=destination,
+            limit=limit,
+            offset=offset,
+        )
+
     def get_trip(self, trip_id: int) -> TripSchema:
         return self.query_service.get_trip(trip_id)
 
@@ -881,8 +931,19 @@ def _assign_sub_trip_position(
     )
 
 
+_trip_service: TripService | None = None
+
+
+def get_trip_service() -> TripService:
+    global _trip_service
+    if _trip_service is None:
+        _trip_service = TripService()
+    return _trip_service
+
+
 __all__ = [
     "TripService",
+    "get_trip_service",
     "TripServiceError",
     "ResourceNotFoundError",
     "TripValidationError",
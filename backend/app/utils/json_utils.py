@@ -6,6 +6,8 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any
 
+import orjson
+
 
 def _json_default(value: Any) -> Any:
     if isinstance(value, (datetime, date, time)):
@@ -29,3 +31,11 @@ def json_dumps(value: Any, **kwargs: Any) -> str:
     kwargs.setdefault("ensure_ascii", False)
     kwargs.setdefault("default", _json_default)
     return json.dumps(value, **kwargs)
+
+
+def orjson_dumps(value: Any) -> str:
+    """orjson counterpart of :func:`json_dumps` (str output, non-str keys allowed)."""
+
+    return orjson.dumps(
+        value, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
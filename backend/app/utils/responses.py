@@ -1,10 +1,29 @@
 from typing import Any
 
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 def success_response(data: Any, msg: str = "ok", code: int = 0) -> dict[str, Any]:
     """Return payload formatted per project contract."""
     return {"code": code, "msg": msg, "data": data}
 
 
+def success_json_response(data_json: bytes, msg: str = "ok", code: int = 0) -> Response:
+    """Wrap already-serialised JSON ``data`` in the success envelope as bytes."""
+    head = orjson.dumps({"code": code, "msg": msg})
+    return Response(
+        head[:-1] + b',"data":' + data_json + b"}",
+        media_type="application/json",
+    )
+
+
 def error_response(msg: str, code: int = 10001, data: Any = None) -> dict[str, Any]:
     return {"code": code, "msg": msg, "data": data}
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+import orjson
+
+SSE_DONE: bytes = b"data: [DONE]\n\n"
 
-def sse_data(payload: dict[str, Any]) -> str:
-    """Format a single Server-Sent Events data message."""
 
-    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+def sse_data(payload: dict[str, Any]) -> bytes:
+    """Format a single Server-Sent Events data message."""
 
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
 
-def sse_done() -> str:
-    return "data: [DONE]\n\n"
 
+def sse_done() -> bytes:
+    return SSE_DONE
@@ -0,0 +1,52 @@
+"""Composite index for per-user ai_tasks lookups.
+
+Notes:
+- `(user_id, status, created_at DESC)` supersedes the single-column
+  `ix_ai_tasks_user_id`, so the latter is dropped.
+- Defensive like stage 8: legacy `ai_tasks` tables may lack either index.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_04"
+down_revision = "20251214_03"
+branch_labels = None
+depends_on = None
+
+
+def _index_names(inspector: sa.Inspector) -> set[str]:
+    return {
+        idx.get("name") for idx in inspector.get_indexes("ai_tasks") if idx.get("name")
+    }
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("ai_tasks"):
+        return
+
+    existing_indexes = _index_names(inspector)
+    if "ix_ai_tasks_user_status_created" not in existing_indexes:
+        op.create_index(
+            "ix_ai_tasks_user_status_created",
+            "ai_tasks",
+            ["user_id", "status", sa.text("created_at DESC")],
+        )
+    if "ix_ai_tasks_user_id" in existing_indexes:
+        op.drop_index("ix_ai_tasks_user_id", table_name="ai_tasks")
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("ai_tasks"):
+        return
+
+    existing_indexes = _index_names(inspector)
+    if "ix_ai_tasks_user_id" not in existing_indexes:
+        op.create_index("ix_ai_tasks_user_id", "ai_tasks", ["user_id"])
+    if "ix_ai_tasks_user_status_created" in existing_indexes:
+        op.drop_index("ix_ai_tasks_user_status_created", table_name="ai_tasks")
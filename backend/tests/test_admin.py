@@ -71,6 +71,29 @@ def test_admin_sql_test_allows_select_only(client):
     assert data["rows"][0]["a"] == 1
 
 
+def test_admin_sql_test_accepts_uppercase_with_leading_whitespace(client):
+    resp = client.post(
+        "/admin/api/sql_test",
+        json={"query": "  SELECT 2 AS b"},
+        headers=_admin_headers(),
+    )
+    assert resp.status_code == 200
+    assert resp.json()["data"]["rows"][0]["b"] == 2
+
+
+def test_admin_sql_test_caps_rows_and_flags_truncation(client):
+    resp = client.post(
+        "/admin/api/sql_test",
+        json={"query": "select generate_series(1, 500) as n limit 300"},
+        headers=_admin_headers(),
+    )
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["count"] == settings.admin_sql_console_max_rows
+    assert len(data["rows"]) == data["limit"]
+    assert data["truncated"] is True
+
+
 def test_admin_sql_test_rejects_multiple_statements(client):
     resp = client.post(
         "/admin/api/sql_test",
@@ -228,6 +251,27 @@ def test_admin_db_schema_endpoint_returns_tables(client):
     assert "trips" in data["tables"]
 
 
+def test_admin_db_schema_refresh_requires_auth_and_rebuilds(client):
+    assert client.post("/admin/db/schema/refresh").status_code == 401
+    resp = client.post("/admin/db/schema/refresh", headers=_admin_headers())
+    assert resp.status_code == 200
+    assert "trips" in resp.json()["data"]["tables"]
+
+
+def test_admin_db_schema_get_ignores_refresh(client, monkeypatch):
+    from app.admin.service import get_admin_service
+
+    calls: list[None] = []
+    monkeypatch.setattr(
+        get_admin_service(),
+        "invalidate_db_schema_cache",
+        lambda: calls.append(None),
+    )
+    resp = client.get("/admin/db/schema?refresh=1")
+    assert resp.status_code == 200
+    assert calls == []
+
+
 def test_admin_api_docs_page_serves_html(client):
     resp = client.get("/admin/api-docs")
     assert resp.status_code == 200
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -56,3 +59,52 @@ def test_chat_endpoint_reuses_session(client: TestClient) -> None:
     data = resp.json()["data"]
     assert data["session_id"] == session_id
     assert len(data["messages"]) >= 2
+
+
+class _StubChatService:
+    def __init__(self, chunks: int = 0, error: Exception | None = None) -> None:
+        self._chunks = chunks
+        self._error = error
+
+    async def run_chat(self, payload, stream_handler=None):
+        from app.ai import AiStreamChunk
+
+        for index in range(self._chunks):
+            await stream_handler(
+                AiStreamChunk(delta="x", index=index, done=False, trace_id="ai-t")
+            )
+        raise self._error or RuntimeError("boom")
+
+
+async def _read_stream(response) -> list[bytes]:
+    return [frame async for frame in response.body_iterator]
+
+
+@pytest.mark.asyncio
+async def test_chat_demo_stream_reports_unexpected_error() -> None:
+    from app.api import ai
+    from app.models.ai_schemas import ChatDemoPayload
+
+    response = await ai._stream_chat(
+        _StubChatService(), ChatDemoPayload(**_chat_payload())
+    )
+    body = b"".join(await _read_stream(response))
+    assert b'"event":"error"' in body
+    assert b'"error_type":"RuntimeError"' in body
+    assert body.endswith(b"data: [DONE]\n\n")
+
+
+@pytest.mark.asyncio
+async def test_chat_demo_stream_ends_when_client_stalls(monkeypatch) -> None:
+    from app.api import ai
+    from app.models.ai_schemas import ChatDemoPayload
+
+    monkeypatch.setattr(ai, "_SSE_QUEUE_MAXSIZE", 2)
+    monkeypatch.setattr(ai, "_SSE_PUT_TIMEOUT_S", 0.05)
+    response = await ai._stream_chat(
+        _StubChatService(chunks=10), ChatDemoPayload(**_chat_payload())
+    )
+    await asyncio.sleep(0.2)  # 客户端不读：producer 超时后应自行结束
+    frames = await asyncio.wait_for(_read_stream(response), timeout=1)
+    assert len(frames) == 1
+    assert frames[0].count(b'"event":"chunk"') == 2
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+
+from app.core.cache import CacheBackend
+
+
+def test_cache_backend_evicts_least_recently_used_per_namespace():
+    cache = CacheBackend(max_entries_per_ns=2)
+    cache.set("ns", "a", 1, ttl_seconds=60)
+    cache.set("ns", "b", 2, ttl_seconds=60)
+    assert cache.get("ns", "a") == 1  # touch "a" so "b" becomes the oldest
+
+    cache.set("ns", "c", 3, ttl_seconds=60)
+
+    assert cache.get("ns", "b") is None
+    assert cache.get("ns", "a") == 1
+    assert cache.get("ns", "c") == 3
+
+
+def test_cache_backend_namespaces_are_isolated():
+    cache = CacheBackend()
+    cache.set("poi", "k", "poi-value", ttl_seconds=60)
+    cache.set("plan", "k", "plan-value", ttl_seconds=60)
+
+    cache.invalidate("poi")
+
+    assert cache.get("poi", "k") is None
+    assert cache.get("plan", "k") == "plan-value"
+
+
+def test_cache_backend_tracks_hits_and_misses():
+    cache = CacheBackend()
+    assert cache.remember("ns", "k", 60, lambda: "v") == "v"
+    assert cache.remember("ns", "k", 60, lambda: "other") == "v"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_cache_backend_bulk_set_and_get():
+    cache = CacheBackend()
+    cache.set_many("ns", {"a": 1, "b": 2}, ttl_seconds=60)
+
+    assert cache.get_many("ns", ["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+
+def test_cache_backend_remember_async_runs_loader_once_for_concurrent_misses():
+    cache = CacheBackend()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "v"
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.remember_async("ns", "k", 60, loader) for _ in range(5))
+        )
+
+    assert asyncio.run(run()) == ["v"] * 5
+    assert calls == 1
+
+
+def test_cache_backend_set_drops_expired_entries_from_lru_head(monkeypatch):
+    import app.core.cache as cache_module
+
+    clock = [1000.0]
+    monkeypatch.setattr(cache_module, "monotonic", lambda: clock[0])
+    cache = CacheBackend()
+    cache.set("ns", "stale-a", 1, ttl_seconds=1)
+    cache.set("ns", "stale-b", 2, ttl_seconds=1)
+    clock[0] += 5
+
+    cache.set("ns", "new", 3, ttl_seconds=60)
+
+    assert cache.stats()["entries"] == 1
+    assert cache.get("ns", "new") == 3
+
+
+def test_cache_backend_set_is_safe_against_concurrent_lock_free_gets():
+    cache = CacheBackend(max_entries_per_ns=32)
+    keys = [f"k{i}" for i in range(32)]
+    for key in keys:
+        cache.set("ns", key, key, ttl_seconds=60)
+    errors: list[BaseException] = []
+    stop = threading.Event()
+
+    def reader() -> None:
+        while not stop.is_set():
+            for key in keys:
+                cache.get("ns", key)  # 无锁读会 move_to_end
+
+    def writer() -> None:
+        try:
+            for i in range(100_000):
+                cache.set("ns", keys[i % len(keys)], i, ttl_seconds=60)
+        except BaseException as exc:  # pragma: no cover - failure path
+            errors.append(exc)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # 放大线程交错概率
+    readers = [threading.Thread(target=reader) for _ in range(3)]
+    try:
+        for thread in readers:
+            thread.start()
+        writer()
+    finally:
+        stop.set()
+        for thread in readers:
+            thread.join()
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+
+
+def test_cache_backend_remember_allows_reentrant_loader_for_same_key():
+    cache = CacheBackend()
+
+    def outer() -> str:
+        # 重入同一 key 不应等待自己持有的 singleflight
+        return cache.remember("ns", "k", 60, lambda: "inner") + "-outer"
+
+    assert cache.remember("ns", "k", 60, outer) == "inner-outer"
+    assert cache.get("ns", "k") == "inner-outer"
+
+
+def test_cache_backend_remember_on_event_loop_does_not_wait_for_other_threads():
+    cache = CacheBackend()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_loader() -> str:
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    leader = threading.Thread(target=cache.remember, args=("ns", "k", 60, slow_loader))
+    leader.start()
+    started.wait(5)
+
+    async def on_loop() -> str:
+        return cache.remember("ns", "k", 60, lambda: "direct")
+
+    try:
+        assert asyncio.run(on_loop()) == "direct"
+    finally:
+        release.set()
+        leader.join()